@@ -1,6 +1,10 @@
-from flask import Flask, render_template, jsonify, request, send_from_directory, send_file, Response
+from flask import Flask, render_template, request, send_from_directory, send_file, Response, stream_with_context
 import os
 import io
+import functools
+import threading
+import orjson
+from collections import Counter
 from datetime import datetime
 from csv_manager import CSVManager, CSVManagerError
 from models import Task, ValidationError
@@ -12,19 +16,220 @@ app = Flask(__name__)
 # Basic configuration
 app.config['SECRET_KEY'] = 'dev-secret-key-change-in-production'
 app.config['CSV_FILE'] = 'tasks.csv'
+app.config['CSV_LOCK_MODE'] = os.environ.get('CSV_LOCK_MODE', 'auto')
 
-# Initialize CSV manager
-csv_manager = CSVManager(app.config['CSV_FILE'])
+# Initialize CSV manager. Handlers use app.csv_manager and
+# app.csv_export_import, so tests can override them by reassigning
+csv_manager = CSVManager(app.config['CSV_FILE'], lock_mode=app.config['CSV_LOCK_MODE'])
 csv_export_import = CSVExportImport(csv_manager)
+app.csv_manager = csv_manager
+app.csv_export_import = csv_export_import
 
-def get_csv_manager():
-    """Get the CSV manager instance, allowing for test overrides"""
-    return getattr(app, 'csv_manager', csv_manager)
+def _json(obj, status=200):
+    """Serialize a response payload with orjson"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
 
-def get_csv_export_import():
-    """Get the CSV export/import instance, allowing for test overrides"""
-    return getattr(app, 'csv_export_import', csv_export_import)
+# Parsed tasks, keyed on the CSV file's path, mtime and size
+_tasks_cache = {'key': None, 'value': None}
+_tasks_cache_lock = threading.RLock()
 
+def csv_state_key(mgr):
+    """Identify the current task data (CSV file plus pending deletes), or None if it can't be read"""
+    version = mgr.data_version()
+    if version is None:
+        return None
+    return (mgr.csv_file_path, version)
+
+def cached_read_tasks(mgr):
+    """Read tasks, re-parsing the CSV only when the file has changed"""
+    key = csv_state_key(mgr)
+    if key is None:
+        return mgr.read_tasks()
+    
+    with _tasks_cache_lock:
+        if _tasks_cache['key'] == key:
+            return _tasks_cache['value']
+        
+        tasks = mgr.read_tasks()
+        _tasks_cache.update(key=key, value=tasks)
+        return tasks
+
+def invalidate_tasks_cache():
+    """Drop the cached task list after a write"""
+    with _tasks_cache_lock:
+        _tasks_cache['key'] = None
+
+# Derived lists (categories, tags) by name: (key, list), where key is the
+# CSV path and data version the list was built from
+_lists_cache = {}
+
+def _memoized_list(mgr, name, build):
+    """
+    Get a list derived from the task columns, rebuilding it only when the
+    data changes. The list is keyed on the version of the columns it was
+    built from, so a write landing meanwhile can't be cached under it.
+    """
+    version, columns = mgr.read_tasks_columnar_versioned()
+    if version is None:
+        return build(columns)
+    
+    key = (mgr.csv_file_path, version)
+    cached = _lists_cache.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    result = build(columns)
+    _lists_cache[name] = (key, result)
+    return result
+
+def _build_categories(columns):
+    """Sorted unique categories"""
+    return sorted({(category or '').strip() for category in columns['category']} - {''})
+
+def _build_tags(columns):
+    """Sorted unique tags"""
+    return sorted({
+        tag
+        for tags in columns['tags'] if tags
+        for tag in map(str.strip, tags.split(',')) if tag
+    })
+
+# Task statistics, maintained incrementally as tasks are written
+_stats = {
+    'by_status': Counter(),
+    'by_priority': Counter(),
+    'by_assignee': Counter(),
+    'by_category': Counter(),
+    'by_tags': Counter()
+}
+_stats_state = {'key': None}
+_stats_lock = threading.Lock()
+
+def _stats_apply(task, delta):
+    """Add (delta=1) or remove (delta=-1) a task's contribution to the stats"""
+    _stats['by_status'][task.get('status') or 'Not Started'] += delta
+    _stats['by_priority'][task.get('priority') or 'Medium'] += delta
+    _stats['by_assignee'][(task.get('assignee') or '').strip() or 'Unassigned'] += delta
+    _stats['by_category'][(task.get('category') or '').strip() or 'Uncategorized'] += delta
+    
+    tags = task.get('tags')
+    if tags:
+        by_tags = _stats['by_tags']
+        for tag in tags.split(','):
+            tag = tag.strip()
+            if tag:
+                by_tags[tag] += delta
+
+def _count_column(values, default):
+    """Count a column's values, folding empty ones into default"""
+    counts = Counter(values)
+    empty = counts.pop(None, 0) + counts.pop('', 0)
+    if empty:
+        counts[default] += empty
+    return counts
+
+def _rebuild_stats(columns):
+    """Recount the stats from scratch, from CSVManager.read_tasks_columnar()"""
+    for counter in _stats.values():
+        counter.clear()
+    
+    # Counting a whole column in one Counter() call runs in C; values
+    # read back from the CSV are already stripped
+    _stats['by_status'].update(_count_column(columns['status'], 'Not Started'))
+    _stats['by_priority'].update(_count_column(columns['priority'], 'Medium'))
+    _stats['by_assignee'].update(_count_column(columns['assignee'], 'Unassigned'))
+    _stats['by_category'].update(_count_column(columns['category'], 'Uncategorized'))
+    _stats['by_tags'].update(
+        tag
+        for tags in columns['tags'] if tags
+        for tag in map(str.strip, tags.split(',')) if tag
+    )
+
+def current_stats(mgr):
+    """Get the task stats, recounting only if the CSV changed behind our back"""
+    with _stats_lock:
+        key = csv_state_key(mgr)
+        if key is None or _stats_state['key'] != key:
+            # Key the stats on the version the columns came from; a write
+            # landing after the stat above must not count as included
+            version, columns = mgr.read_tasks_columnar_versioned()
+            _rebuild_stats(columns)
+            _stats_state['key'] = (mgr.csv_file_path, version) if version is not None else None
+        
+        # Unary plus drops categories whose count has fallen to zero
+        return {name: dict(+counter) for name, counter in _stats.items()}
+
+def record_stats_change(mgr, removed=(), added=()):
+    """
+    Apply the task write just made by this thread to the stats, given the
+    rows it removed and the rows it added. Unless the write started from
+    the state the stats were counted from, leave them stale so they get
+    recounted. The new key is the version the write itself produced, so
+    changes made by other processes meanwhile are never taken as counted.
+    """
+    versions = mgr.last_write_versions()
+    with _stats_lock:
+        if (versions is None or versions[1] is None
+                or _stats_state['key'] != (mgr.csv_file_path, versions[0])):
+            _stats_state['key'] = None
+            return
+        
+        for task in removed:
+            _stats_apply(task, -1)
+        for task in added:
+            _stats_apply(task, 1)
+        _stats_state['key'] = (mgr.csv_file_path, versions[1])
+
+
+def _load_json_body():
+    """
+    Parse the request body with orjson rather than Flask's stdlib decoder,
+    like request.get_json(force=True, silent=True): returns None instead of
+    raising when the body is missing or not valid JSON
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+def api_write(require_json=True):
+    """
+    Decorator for endpoints that need network connectivity. Rejects requests
+    sent with the X-Offline-Mode header and, when require_json is set, parses
+    the JSON body and passes it to the handler as `data`.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if request.headers.get('X-Offline-Mode') == 'true':
+                return _json({
+                    'success': False,
+                    'error': 'You are offline. This request requires network connectivity.',
+                    'offline': True
+                }, 503)
+            
+            if require_json:
+                data = _load_json_body()
+                if data is None:
+                    return _json({
+                        'success': False,
+                        'error': 'Invalid JSON data'
+                    }, 400)
+                
+                if not data:
+                    return _json({
+                        'success': False,
+                        'error': 'No data provided'
+                    }, 400)
+                
+                kwargs['data'] = data
+            
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
 
 
 @app.route('/')
@@ -38,130 +243,83 @@ def get_tasks():
     try:
         # Check if this is just a ping request to check connectivity
         if request.args.get('ping') == '1':
-            return jsonify({'success': True, 'ping': 'pong'})
+            return _json({'success': True, 'ping': 'pong'})
             
-        manager = get_csv_manager()
-        tasks = manager.read_tasks()
-        
-        # Convert datetime objects to ISO strings for JSON serialization
-        for task in tasks:
-            for field in ['created_date', 'opened_date', 'completion_date']:
-                if task.get(field) and isinstance(task[field], datetime):
-                    task[field] = task[field].isoformat()
+        manager = app.csv_manager
+        tasks = cached_read_tasks(manager)
         
-        return jsonify({
+        # orjson serializes any datetime values directly
+        return _json({
             'success': True,
             'tasks': tasks,
             'count': len(tasks)
         })
     
     except CSVManagerError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/tasks', methods=['POST'])
-def create_task():
+@api_write()
+def create_task(data):
     """Create a new task"""
     try:
-        # Check for offline header - if present, return a special response
-        if request.headers.get('X-Offline-Mode') == 'true':
-            return jsonify({
-                'success': False,
-                'error': 'You are offline. This request requires network connectivity.',
-                'offline': True
-            }), 503
-            
-        # Get JSON data from request
-        try:
-            data = request.get_json(force=True)
-        except Exception:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid JSON data'
-            }), 400
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided'
-            }), 400
-        
         # Create and validate task
         task = Task.from_dict(data)
         task_dict = task.to_dict()
         
         # Add task to CSV
-        manager = get_csv_manager()
+        manager = app.csv_manager
         task_id = manager.add_task(task_dict)
+        invalidate_tasks_cache()
+        record_stats_change(manager, added=[task_dict])
         
-        return jsonify({
+        return _json({
             'success': True,
             'message': 'Task created successfully',
             'task_id': task_id,
             'task': task_dict
-        }), 201
+        }, 201)
     
     except ValidationError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': f'Validation error: {str(e)}'
-        }), 400
+        }, 400)
     
     except CSVManagerError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }),500
+        }, 500)
 
 @app.route('/api/tasks/<task_id>', methods=['PUT'])
-def update_task(task_id):
+@api_write()
+def update_task(task_id, data):
     """Update an existing task"""
     try:
-        # Check for offline header - if present, return a special response
-        if request.headers.get('X-Offline-Mode') == 'true':
-            return jsonify({
-                'success': False,
-                'error': 'You are offline. This request requires network connectivity.',
-                'offline': True
-            }), 503
-            
-        # Get JSON data from request
-        try:
-            data = request.get_json(force=True)
-        except Exception:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid JSON data'
-            }), 400
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No data provided'
-            }), 400
-        
         # Check if task exists
-        manager = get_csv_manager()
+        manager = app.csv_manager
         existing_task = manager.get_task_by_id(task_id)
         if not existing_task:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'Task not found'
-            }), 404
+            }, 404)
         
         # Check for conflict (if client provides a timestamp)
         if data.get('_last_modified') and existing_task.get('_last_modified'):
@@ -169,18 +327,21 @@ def update_task(task_id):
             server_timestamp = existing_task.get('_last_modified')
             
             if client_timestamp < server_timestamp:
-                return jsonify({
+                return _json({
                     'success': False,
                     'error': 'Conflict: Task was modified by another user',
                     'conflict': True,
                     'server_task': existing_task
-                }), 409
-        
-        # Merge existing data with updates
-        updated_data = existing_task.copy()
-        updated_data.update(data)
-        updated_data['id'] = task_id  # Ensure ID doesn't change
-        updated_data['_last_modified'] = datetime.now().isoformat()  # Add timestamp for conflict detection
+                }, 409)
+        
+        # Merge existing data with updates, keeping the ID and adding a
+        # timestamp for conflict detection
+        updated_data = {
+            **existing_task,
+            **data,
+            'id': task_id,
+            '_last_modified': datetime.now().isoformat()
+        }
         
         # Validate updated task
         task = Task.from_dict(updated_data)
@@ -188,362 +349,332 @@ def update_task(task_id):
         
         # Update task in CSV
         success = manager.update_task(task_id, task_dict)
+        invalidate_tasks_cache()
         
         if not success:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'Task not found'
-            }), 404
+            }, 404)
         
-        return jsonify({
+        record_stats_change(manager, removed=[existing_task], added=[task_dict])
+        
+        return _json({
             'success': True,
             'message': 'Task updated successfully',
             'task': task_dict
         })
     
     except ValidationError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': f'Validation error: {str(e)}'
-        }), 400
+        }, 400)
     
     except CSVManagerError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/tasks/<task_id>', methods=['DELETE'])
+@api_write(require_json=False)
 def delete_task(task_id):
     """Delete a task"""
     try:
-        # Check for offline header - if present, return a special response
-        if request.headers.get('X-Offline-Mode') == 'true':
-            return jsonify({
-                'success': False,
-                'error': 'You are offline. This request requires network connectivity.',
-                'offline': True
-            }), 503
-            
         # Check if task exists
-        manager = get_csv_manager()
-        existing_task = manager.get_task_by_id(task_id)
-        if not existing_task:
-            return jsonify({
+        manager = app.csv_manager
+        # Every row with this ID is deleted, and each one leaves the stats
+        existing_rows = manager.get_tasks_by_id(task_id)
+        if not existing_rows:
+            return _json({
                 'success': False,
                 'error': 'Task not found'
-            }), 404
+            }, 404)
         
         # Delete task from CSV
         success = manager.delete_task(task_id)
+        invalidate_tasks_cache()
         
         if not success:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'Task not found'
-            }), 404
+            }, 404)
         
-        return jsonify({
+        record_stats_change(manager, removed=existing_rows)
+        
+        return _json({
             'success': True,
             'message': 'Task deleted successfully'
         })
     
     except CSVManagerError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
     """Get task statistics for charts"""
     try:
-        manager = get_csv_manager()
-        tasks = manager.read_tasks()
-        
-        # Initialize counters
-        stats = {
-            'by_status': {},
-            'by_priority': {},
-            'by_assignee': {}
-        }
-        
-        # Count tasks by status
-        for task in tasks:
-            status = task.get('status', 'Not Started')
-            stats['by_status'][status] = stats['by_status'].get(status, 0) + 1
-        
-        # Count tasks by priority
-        for task in tasks:
-            priority = task.get('priority', 'Medium')
-            stats['by_priority'][priority] = stats['by_priority'].get(priority, 0) + 1
-        
-        # Count tasks by assignee
-        for task in tasks:
-            assignee = task.get('assignee') or ''
-            assignee = assignee.strip() if assignee else ''
-            if not assignee:
-                assignee = 'Unassigned'
-            stats['by_assignee'][assignee] = stats['by_assignee'].get(assignee, 0) + 1
+        manager = app.csv_manager
+        stats = current_stats(manager)
         
-        # Count tasks by category
-        stats['by_category'] = {}
-        for task in tasks:
-            category = task.get('category') or ''
-            category = category.strip() if category else ''
-            if not category:
-                category = 'Uncategorized'
-            stats['by_category'][category] = stats['by_category'].get(category, 0) + 1
-        
-        # Count tasks by tags
-        stats['by_tags'] = {}
-        for task in tasks:
-            tags = task.get('tags') or ''
-            if tags.strip():
-                tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
-                for tag in tag_list:
-                    stats['by_tags'][tag] = stats['by_tags'].get(tag, 0) + 1
-        
-        return jsonify({
+        return _json({
             'success': True,
             'stats': stats
         })
     
     except CSVManagerError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
-@app.route('/api/categories', methods=['GET'])
+@app.route('/api/backup', methods=['POST'])
+@api_write(require_json=False)
 def create_backup():
     """Create a backup of the current tasks"""
     try:
-        # Check for offline header - if present, return a special response
-        if request.headers.get('X-Offline-Mode') == 'true':
-            return jsonify({
-                'success': False,
-                'error': 'You are offline. This request requires network connectivity.',
-                'offline': True
-            }), 503
-            
-        exporter = get_csv_export_import()
-        backup_path = exporter.create_backup()
+        exporter = app.csv_export_import
+        backup_path, job_id = exporter.create_backup_async()
         
-        return jsonify({
+        # The copy finishes in the background; poll /api/backups/status/<job_id>
+        return _json({
             'success': True,
-            'message': 'Backup created successfully',
-            'backup_path': backup_path
+            'message': 'Backup started',
+            'backup_path': backup_path,
+            'job_id': job_id
         })
     
     except CSVExportImportError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+    
+    except Exception as e:
+        return _json({
+            'success': False,
+            'error': 'Internal server error'
+        }, 500)
+
+@app.route('/api/backups/status/<job_id>', methods=['GET'])
+def backup_status(job_id):
+    """Get the status of a background backup"""
+    try:
+        exporter = app.csv_export_import
+        status = exporter.backup_status(job_id)
+        
+        if status is None:
+            return _json({
+                'success': False,
+                'error': 'Backup job not found'
+            }, 404)
+        
+        return _json({
+            'success': True,
+            'backup': status
+        })
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/restore', methods=['POST'])
-def restore_backup():
+@api_write()
+def restore_backup(data):
     """Restore tasks from a backup file"""
     try:
-        # Check for offline header - if present, return a special response
-        if request.headers.get('X-Offline-Mode') == 'true':
-            return jsonify({
-                'success': False,
-                'error': 'You are offline. This request requires network connectivity.',
-                'offline': True
-            }), 503
-            
         # Get backup path from request
-        data = request.get_json(force=True)
         backup_path = data.get('backup_path')
         
         if not backup_path:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'No backup path provided'
-            }), 400
+            }, 400)
         
         # Restore from backup
-        exporter = get_csv_export_import()
+        exporter = app.csv_export_import
         success = exporter.restore_from_backup(backup_path)
+        invalidate_tasks_cache()
         
-        return jsonify({
+        return _json({
             'success': success,
             'message': 'Backup restored successfully'
         })
     
     except CSVExportImportError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 400
+        }, 400)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/categories', methods=['GET'])
 def get_categories():
     """Get all unique categories"""
     try:
-        manager = get_csv_manager()
-        tasks = manager.read_tasks()
-        
-        categories = set()
-        for task in tasks:
-            category = task.get('category', '').strip()
-            if category:
-                categories.add(category)
+        manager = app.csv_manager
+        # Only rebuilt when the CSV file changes
+        categories = _memoized_list(manager, 'categories', _build_categories)
         
-        return jsonify({
+        return _json({
             'success': True,
-            'categories': sorted(list(categories))
+            'categories': categories
         })
     
     except CSVManagerError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/tags', methods=['GET'])
 def get_tags():
     """Get all unique tags"""
     try:
-        manager = get_csv_manager()
-        tasks = manager.read_tasks()
+        manager = app.csv_manager
+        # Only rebuilt when the CSV file changes
+        tags = _memoized_list(manager, 'tags', _build_tags)
         
-        tags = set()
-        for task in tasks:
-            task_tags = task.get('tags') or ''
-            if isinstance(task_tags, str) and task_tags.strip():
-                tag_list = [tag.strip() for tag in task_tags.split(',') if tag.strip()]
-                tags.update(tag_list)
-        
-        return jsonify({
+        return _json({
             'success': True,
-            'tags': sorted(list(tags))
+            'tags': tags
         })
     
     except CSVManagerError as e:
-        return jsonify({
+        return _json({
+            'success': False,
+            'error': str(e)
+        }, 500)
+    
+    except Exception as e:
+        return _json({
+            'success': False,
+            'error': 'Internal server error'
+        }, 500)
+
+@app.route('/api/export', methods=['GET'])
+def export_tasks():
+    """Download all tasks as a CSV file"""
+    try:
+        exporter = app.csv_export_import
+        chunks, filename = exporter.stream_tasks_csv()
+        
+        # Stream the CSV so only one chunk of encoded text is held at a
+        # time; the task list itself is still read up front
+        return Response(
+            stream_with_context(chunks),
+            mimetype='text/csv',
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
+        )
+    
+    except CSVExportImportError as e:
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/backups', methods=['GET'])
+@api_write(require_json=False)
 def list_backups():
     """List all available backups"""
     try:
-        # Check for offline header - if present, return a special response
-        if request.headers.get('X-Offline-Mode') == 'true':
-            return jsonify({
-                'success': False,
-                'error': 'You are offline. This request requires network connectivity.',
-                'offline': True
-            }), 503
-            
-        exporter = get_csv_export_import()
+        exporter = app.csv_export_import
         backups = exporter.list_backups()
         
-        return jsonify({
+        return _json({
             'success': True,
             'backups': backups
         })
     
     except CSVExportImportError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/backup/delete', methods=['POST'])
-def delete_backup():
+@api_write()
+def delete_backup(data):
     """Delete a backup file"""
     try:
-        # Check for offline header - if present, return a special response
-        if request.headers.get('X-Offline-Mode') == 'true':
-            return jsonify({
-                'success': False,
-                'error': 'You are offline. This request requires network connectivity.',
-                'offline': True
-            }), 503
-            
         # Get backup path from request
-        data = request.get_json(force=True)
         backup_path = data.get('backup_path')
         
         if not backup_path:
-            return jsonify({
+            return _json({
                 'success': False,
                 'error': 'No backup path provided'
-            }), 400
+            }, 400)
         
         # Delete backup
-        exporter = get_csv_export_import()
+        exporter = app.csv_export_import
         success = exporter.delete_backup(backup_path)
         
-        return jsonify({
+        return _json({
             'success': success,
             'message': 'Backup deleted successfully'
         })
     
     except CSVExportImportError as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': str(e)
-        }), 400
+        }, 400)
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/preferences', methods=['GET'])
 def get_preferences():
@@ -551,49 +682,36 @@ def get_preferences():
     try:
         # For now, preferences are stored client-side only
         # This endpoint can be used for server-side preference storage in the future
-        return jsonify({
+        return _json({
             'success': True,
             'message': 'Preferences are stored client-side',
             'preferences': {}
         })
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 @app.route('/api/preferences', methods=['POST'])
-def save_preferences():
+@api_write()
+def save_preferences(data):
     """Save user preferences"""
     try:
-        # Get JSON data from request
-        try:
-            data = request.get_json(force=True)
-        except Exception:
-            return jsonify({
-                'success': False,
-                'error': 'Invalid JSON data'
-            }), 400
-        
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'No preferences data provided'
-            }), 400
-        
         # For now, just acknowledge the save
         # In the future, this could store preferences server-side
-        return jsonify({
+        return _json({
             'success': True,
             'message': 'Preferences saved successfully (client-side storage)'
         })
     
     except Exception as e:
-        return jsonify({
+        return _json({
             'success': False,
             'error': 'Internal server error'
-        }), 500
+        }, 500)
 
 if __name__ == '__main__':
+    # Development server only; see gunicorn_conf.py for production
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
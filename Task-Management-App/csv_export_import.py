@@ -3,10 +3,162 @@ CSV Export/Import functionality for Flask Todo App
 """
 import os
 import io
+import re
 import csv
+import uuid
 import shutil
+import tempfile
+import time
+import operator
+import concurrent.futures
 from datetime import datetime
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Tuple, Optional, Iterator
+
+
+# Defaults for fields missing from imported rows
+_ROW_DEFAULTS = {
+    'priority': 'Medium',
+    'status': 'Not Started',
+    'description': '',
+    'assignee': '',
+    'category': '',
+    'tags': ''
+}
+
+
+def _clean_rows(headers: List[str], rows, imported_tasks: List[Dict[str, Any]],
+                error_tasks: List[Dict[str, Any]]) -> None:
+    """
+    Clean and validate parsed CSV rows for import
+    
+    Pure-Python fallback for csv_import_fast.clean_rows, which is used
+    instead when the optional Cython extension has been built.
+    
+    Args:
+        headers: Stripped header names, in column order
+        rows: Iterable of row lists from csv.reader
+        imported_tasks: List that receives cleaned task dictionaries
+        error_tasks: List that receives per-row error details
+    """
+    for row_num, row in enumerate(rows, start=2):  # Start at 2 for header
+        if not row:  # Skip blank lines
+            continue
+        
+        try:
+            # Clean up the row data; columns without a header are dropped
+            task_data = {header: value.strip() for header, value in zip(headers, row) if header}
+            
+            # Validate required fields
+            if not task_data.get('task'):
+                error_tasks.append({
+                    'row': row_num,
+                    'error': 'Missing required field: task',
+                    'data': task_data
+                })
+                continue
+            
+            # Add default values for missing fields
+            task_data = {**_ROW_DEFAULTS, **task_data}
+            
+            # Set created_date if not provided
+            if not task_data.get('created_date'):
+                task_data['created_date'] = datetime.now().isoformat()
+            
+            imported_tasks.append(task_data)
+            
+        except Exception as e:
+            error_tasks.append({
+                'row': row_num,
+                'error': str(e),
+                'data': row
+            })
+
+
+def _copy_open_file(fsrc, dst: str, preserve_metadata: bool = True) -> None:
+    """
+    Copy an already open file, in-kernel where the platform supports it
+    
+    Uses os.copy_file_range so the data never passes through userspace, and
+    falls back to a buffered copy on platforms or filesystems without it.
+    Copying from a handle lets the caller open the source up front: the copy
+    still sees that version even if the path is atomically replaced meanwhile.
+    
+    Args:
+        fsrc: Source file opened in binary mode, positioned at the start
+        dst: Destination path, overwritten if it exists
+        preserve_metadata: Whether to copy the source's timestamps like shutil.copy2
+    """
+    st = os.fstat(fsrc.fileno())
+    
+    with open(dst, 'wb') as fdst:
+        remaining = st.st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            # Start over with a plain userspace copy
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    
+    if preserve_metadata:
+        os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def _fast_copy(src: str, dst: str, preserve_metadata: bool = True) -> None:
+    """Copy a file by path; see _copy_open_file"""
+    with open(src, 'rb') as fsrc:
+        _copy_open_file(fsrc, dst, preserve_metadata)
+
+
+def _copy_and_close(fsrc, dst: str) -> None:
+    """
+    Background backup job: copy an open file, then release its handle
+    
+    The copy is written to dst + PENDING_SUFFIX and renamed to dst once it
+    is complete; if it fails, the error is left in dst + FAILED_SUFFIX. The
+    job's status can thus be read from the backup directory by any process.
+    """
+    pending = dst + PENDING_SUFFIX
+    try:
+        _copy_open_file(fsrc, pending)
+        os.replace(pending, dst)
+    except Exception as e:
+        with open(dst + FAILED_SUFFIX, 'w', encoding='utf-8') as f:
+            f.write(str(e))
+        if os.path.exists(pending):
+            os.unlink(pending)
+        raise
+    finally:
+        fsrc.close()
+
+
+# Shared pool that runs backup copies off the request thread
+_backup_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='backup')
+
+# Markers next to a backup while its copy runs, and when it has failed
+PENDING_SUFFIX = '.part'
+FAILED_SUFFIX = '.failed'
+
+# A copy in progress keeps writing to its .part file; one untouched for this
+# many seconds was left behind by a worker that died mid-copy
+STALE_PENDING_SECONDS = 600
+
+# Backup job IDs are the backup filenames without '.csv'
+_BACKUP_JOB_ID_RE = re.compile(r'tasks_backup_\d{8}_\d{6}_\d{6}')
+
+
+# Use the compiled row cleaner when the optional extension has been built
+try:
+    from csv_import_fast import clean_rows
+    HAS_CSV_IMPORT_FAST = True
+except ImportError:
+    clean_rows = _clean_rows
+    HAS_CSV_IMPORT_FAST = False
 
 
 class CSVExportImportError(Exception):
@@ -22,6 +174,10 @@ class CSVExportImport:
         self.csv_manager = csv_manager
         self.backup_dir = 'backups'
         
+        # Backup listing, valid while the backup directory's mtime is unchanged
+        self._backups_cache = None
+        self._backups_mtime = None
+        
         # Create backup directory if it doesn't exist
         if not os.path.exists(self.backup_dir):
             os.makedirs(self.backup_dir)
@@ -33,37 +189,66 @@ class CSVExportImport:
         Returns:
             Tuple of (StringIO object with CSV content, filename)
         """
+        chunks, filename = self.stream_tasks_csv()
+        
         try:
-            tasks = self.csv_manager.read_tasks()
-            
-            # Create StringIO object for CSV content
             output = io.StringIO()
+            output.writelines(chunks)
+            return output, filename
+            
+        except Exception as e:
+            raise CSVExportImportError(f"Failed to export tasks: {str(e)}")
+    
+    def stream_tasks_csv(self, rows_per_chunk: int = 500) -> Tuple[Iterator[str], str]:
+        """
+        Export all tasks to CSV format as a stream of text chunks
+        
+        Tasks are read up front so read errors surface before streaming
+        starts; the CSV text is then produced one chunk at a time.
+        
+        Args:
+            rows_per_chunk: Number of task rows encoded per chunk
+            
+        Returns:
+            Tuple of (iterator of CSV text chunks, filename)
+        """
+        try:
+            tasks = self.csv_manager.read_tasks()
             
             if tasks:
                 # Get headers from the first task
                 headers = list(tasks[0].keys())
-                
-                # Write CSV content
-                writer = csv.DictWriter(output, fieldnames=headers)
-                writer.writeheader()
-                writer.writerows(tasks)
             else:
-                # Write empty CSV with standard headers
+                # Empty CSV with standard headers
                 headers = ['id', 'task', 'priority', 'description', 'created_date', 
                           'assignee', 'opened_date', 'status', 'completion_date', 
                           'category', 'tags']
-                writer = csv.DictWriter(output, fieldnames=headers)
-                writer.writeheader()
             
             # Generate filename with timestamp
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'tasks_export_{timestamp}.csv'
             
-            return output, filename
+            return self._iter_csv_chunks(tasks, headers, rows_per_chunk), filename
             
         except Exception as e:
             raise CSVExportImportError(f"Failed to export tasks: {str(e)}")
     
+    def _iter_csv_chunks(self, tasks: List[Dict[str, Any]], headers: List[str],
+                         rows_per_chunk: int) -> Iterator[str]:
+        """Encode tasks as CSV, reusing one buffer for every chunk"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        row_values = operator.itemgetter(*headers)
+        
+        writer.writerow(headers)
+        yield buffer.getvalue()
+        
+        for start in range(0, len(tasks), rows_per_chunk):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(map(row_values, tasks[start:start + rows_per_chunk]))
+            yield buffer.getvalue()
+    
     def import_tasks_from_csv(self, csv_content: str, validate: bool = True, 
                              replace_existing: bool = False) -> Dict[str, Any]:
         """
@@ -78,52 +263,28 @@ class CSVExportImport:
             Dictionary with import results
         """
         try:
-            # Create backup before import
-            backup_path = self.create_backup()
+            # Create backup before import; the copy runs in the background
+            # from a snapshot taken before any tasks are written, while the
+            # rows are parsed
+            backup_path, backup = self._start_backup()
             
             # Parse CSV content
-            csv_reader = csv.DictReader(io.StringIO(csv_content))
+            csv_reader = csv.reader(io.StringIO(csv_content))
+            headers = [header.strip() for header in next(csv_reader, [])]
             imported_tasks = []
             skipped_tasks = []
             error_tasks = []
             
-            for row_num, row in enumerate(csv_reader, start=2):  # Start at 2 for header
-                try:
-                    # Clean up the row data
-                    task_data = {}
-                    for key, value in row.items():
-                        if key and value is not None:
-                            task_data[key.strip()] = str(value).strip() if value else ''
-                    
-                    # Validate required fields
-                    if not task_data.get('task'):
-                        error_tasks.append({
-                            'row': row_num,
-                            'error': 'Missing required field: task',
-                            'data': task_data
-                        })
-                        continue
-                    
-                    # Add default values for missing fields
-                    task_data.setdefault('priority', 'Medium')
-                    task_data.setdefault('status', 'Not Started')
-                    task_data.setdefault('description', '')
-                    task_data.setdefault('assignee', '')
-                    task_data.setdefault('category', '')
-                    task_data.setdefault('tags', '')
-                    
-                    # Set created_date if not provided
-                    if not task_data.get('created_date'):
-                        task_data['created_date'] = datetime.now().isoformat()
-                    
-                    imported_tasks.append(task_data)
-                    
-                except Exception as e:
-                    error_tasks.append({
-                        'row': row_num,
-                        'error': str(e),
-                        'data': row
-                    })
+            # Clean and validate each row
+            clean_rows(headers, csv_reader, imported_tasks, error_tasks)
+            
+            # Don't touch the tasks without a good backup. Finishing the copy
+            # also releases its handle on the CSV, which Windows requires
+            # before the file can be replaced
+            try:
+                backup.result()
+            except Exception as e:
+                raise CSVExportImportError(f"Failed to create backup: {str(e)}")
             
             # Import tasks
             if replace_existing:
@@ -137,14 +298,18 @@ class CSVExportImport:
                 
                 new_tasks = []
                 for task in imported_tasks:
-                    if task.get('id') not in existing_ids:
-                        new_tasks.append(task)
-                    else:
+                    if not task.get('id'):
+                        task['id'] = str(uuid.uuid4())
+                    elif task['id'] in existing_ids:
                         skipped_tasks.append(task)
+                        continue
+                    
+                    existing_ids.add(task['id'])
+                    new_tasks.append(task)
                 
-                # Add new tasks
-                for task in new_tasks:
-                    self.csv_manager.add_task(task)
+                # Add new tasks with a single rewrite
+                if new_tasks:
+                    self.csv_manager.add_tasks(new_tasks)
                 
                 imported_count = len(new_tasks)
             
@@ -160,21 +325,130 @@ class CSVExportImport:
         except Exception as e:
             raise CSVExportImportError(f"Failed to import tasks: {str(e)}")
     
-    def create_backup(self) -> str:
+    def create_backup(self, wait: bool = True) -> str:
         """
         Create a backup of the current CSV file
         
+        Args:
+            wait: Whether to wait for the copy to finish. When False the copy
+                runs in the background from a snapshot of the file as it is now
+            
         Returns:
             Path to the backup file
         """
+        backup_path, future = self._start_backup()
+        
+        if wait:
+            try:
+                future.result()
+            except Exception as e:
+                raise CSVExportImportError(f"Failed to create backup: {str(e)}")
+        
+        return backup_path
+    
+    def create_backup_async(self) -> Tuple[str, str]:
+        """
+        Start a backup of the current CSV file in the background
+        
+        Returns:
+            Tuple of (path the backup is written to, job ID for backup_status)
+        """
+        backup_path, _ = self._start_backup()
+        job_id = os.path.splitext(os.path.basename(backup_path))[0]
+        return backup_path, job_id
+    
+    def backup_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a background backup job
+        
+        The status is read from the backup directory rather than from
+        in-memory state, so any worker process can answer it.
+        
+        Args:
+            job_id: ID returned by create_backup_async
+            
+        Returns:
+            Dictionary with the job's status, or None if the job is unknown
+        """
+        if not _BACKUP_JOB_ID_RE.fullmatch(job_id):
+            return None
+        
+        backup_path = os.path.join(self.backup_dir, f'{job_id}.csv')
+        status = {'job_id': job_id, 'backup_path': backup_path}
+        
+        if os.path.exists(backup_path + FAILED_SUFFIX):
+            status['status'] = 'failed'
+            with open(backup_path + FAILED_SUFFIX, 'r', encoding='utf-8') as f:
+                status['error'] = f.read()
+        elif os.path.exists(backup_path):
+            status['status'] = 'completed'
+        elif os.path.exists(backup_path + PENDING_SUFFIX):
+            if self._fail_if_stale(backup_path):
+                return self.backup_status(job_id)
+            status['status'] = 'pending'
+        else:
+            return None
+        
+        return status
+    
+    def _fail_if_stale(self, backup_path: str) -> bool:
+        """
+        Mark a backup as failed if its .part file was abandoned mid-copy
+        
+        Args:
+            backup_path: Final path of the backup
+            
+        Returns:
+            True if the .part file was stale and has been removed
+        """
+        pending = backup_path + PENDING_SUFFIX
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            age = time.time() - os.path.getmtime(pending)
+        except OSError:
+            return False
+        
+        if age < STALE_PENDING_SECONDS:
+            return False
+        
+        with open(backup_path + FAILED_SUFFIX, 'w', encoding='utf-8') as f:
+            f.write('Backup was interrupted before the copy finished')
+        try:
+            os.unlink(pending)
+        except FileNotFoundError:
+            pass
+        return True
+    
+    def _remove_stale_pending(self) -> None:
+        """Clean up .part files left in the backup directory by crashed workers"""
+        with os.scandir(self.backup_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith('tasks_backup_') and entry.name.endswith(PENDING_SUFFIX):
+                    self._fail_if_stale(entry.path[:-len(PENDING_SUFFIX)])
+    
+    def _start_backup(self) -> Tuple[str, concurrent.futures.Future]:
+        """
+        Snapshot the current CSV file and schedule its copy to the backup directory
+        
+        The source is opened before returning, so writes that replace the
+        file afterwards don't leak into the backup.
+        
+        Returns:
+            Tuple of (backup path, future that completes when the copy is done)
+        """
+        try:
+            # Fold pending deletes into the CSV so the raw copy matches what
+            # readers see
+            self.csv_manager.compact()
+            self._remove_stale_pending()
+            
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
             backup_filename = f'tasks_backup_{timestamp}.csv'
             backup_path = os.path.join(self.backup_dir, backup_filename)
             
             # Copy current CSV file to backup location
             if os.path.exists(self.csv_manager.csv_file_path):
-                shutil.copy2(self.csv_manager.csv_file_path, backup_path)
+                fsrc = open(self.csv_manager.csv_file_path, 'rb')
+                future = _backup_pool.submit(_copy_and_close, fsrc, backup_path)
             else:
                 # Create empty backup file if original doesn't exist
                 with open(backup_path, 'w', newline='', encoding='utf-8') as f:
@@ -183,12 +457,22 @@ class CSVExportImport:
                               'assignee', 'opened_date', 'status', 'completion_date', 
                               'category', 'tags']
                     writer.writerow(headers)
+                future = concurrent.futures.Future()
+                future.set_result(None)
             
-            return backup_path
+            # The directory mtime changes when the file appears, not when the
+            # copy finishes, so refresh the listing again once it's complete
+            future.add_done_callback(self._invalidate_backup_listing)
+            
+            return backup_path, future
             
         except Exception as e:
             raise CSVExportImportError(f"Failed to create backup: {str(e)}")
     
+    def _invalidate_backup_listing(self, *args) -> None:
+        """Force the next list_backups call to rescan the backup directory"""
+        self._backups_mtime = None
+    
     def restore_from_backup(self, backup_path: str) -> bool:
         """
         Restore tasks from a backup file
@@ -203,11 +487,29 @@ class CSVExportImport:
             if not os.path.exists(backup_path):
                 raise CSVExportImportError(f"Backup file not found: {backup_path}")
             
-            # Create a backup of current state before restore
-            current_backup = self.create_backup()
+            # Back up the current state in the background while the restored
+            # copy is staged
+            _, current_backup = self._start_backup()
             
-            # Copy backup file to current CSV location
-            shutil.copy2(backup_path, self.csv_manager.csv_file_path)
+            # Stage the backup next to the CSV, then atomically swap it in once
+            # the current state is safely backed up. The backup's timestamps are
+            # not carried over so the restored file reads as freshly changed
+            csv_dir = os.path.dirname(self.csv_manager.csv_file_path) or '.'
+            fd, temp_path = tempfile.mkstemp(dir=csv_dir, suffix='.csv')
+            os.close(fd)
+            try:
+                _fast_copy(backup_path, temp_path, preserve_metadata=False)
+                if os.path.exists(self.csv_manager.csv_file_path):
+                    shutil.copymode(self.csv_manager.csv_file_path, temp_path)
+                current_backup.result()
+                os.replace(temp_path, self.csv_manager.csv_file_path)
+                
+                # Deletes recorded against the old file don't apply to the restored one
+                self.csv_manager.clear_tombstones()
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
             
             return True
             
@@ -225,21 +527,35 @@ class CSVExportImport:
             backups = []
             
             if os.path.exists(self.backup_dir):
-                for filename in os.listdir(self.backup_dir):
-                    if filename.endswith('.csv') and filename.startswith('tasks_backup_'):
-                        filepath = os.path.join(self.backup_dir, filename)
-                        stat = os.stat(filepath)
+                # Adding or removing a backup bumps the directory's mtime
+                dir_mtime = os.stat(self.backup_dir).st_mtime_ns
+                if dir_mtime == self._backups_mtime:
+                    # Copies, so callers can't alter the cached listing
+                    return [dict(backup) for backup in self._backups_cache]
+                
+                # scandir's entries carry the name and path without extra
+                # syscalls, so only matching backups get stat'ed
+                fromtimestamp = datetime.fromtimestamp
+                with os.scandir(self.backup_dir) as entries:
+                    for entry in entries:
+                        filename = entry.name
+                        if not (filename.startswith('tasks_backup_') and filename.endswith('.csv')):
+                            continue
                         
+                        stat = entry.stat()
                         backups.append({
                             'filename': filename,
-                            'path': filepath,
+                            'path': entry.path,
                             'size': stat.st_size,
-                            'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
+                            'created': fromtimestamp(stat.st_ctime).isoformat(),
+                            'modified': fromtimestamp(stat.st_mtime).isoformat()
                         })
-            
-            # Sort by creation time, newest first
-            backups.sort(key=lambda x: x['created'], reverse=True)
+                
+                # Sort by creation time, newest first
+                backups.sort(key=lambda x: x['created'], reverse=True)
+                
+                self._backups_cache = [dict(backup) for backup in backups]
+                self._backups_mtime = dir_mtime
             
             return backups
             
@@ -268,6 +584,7 @@ class CSVExportImport:
                 raise CSVExportImportError("Invalid backup path")
             
             os.remove(backup_path)
+            self._invalidate_backup_listing()
             return True
             
         except Exception as e:
@@ -0,0 +1,74 @@
+# cython: language_level=3
+"""
+Compiled row cleanup for CSV imports
+
+Optional Cython build of csv_export_import._clean_rows; see setup.py.
+"""
+from datetime import datetime
+
+
+# Defaults for fields missing from imported rows
+_ROW_DEFAULTS = {
+    'priority': 'Medium',
+    'status': 'Not Started',
+    'description': '',
+    'assignee': '',
+    'category': '',
+    'tags': ''
+}
+
+
+def clean_rows(list headers, rows, list imported_tasks, list error_tasks):
+    """
+    Clean and validate parsed CSV rows for import
+    
+    Args:
+        headers: Stripped header names, in column order
+        rows: Iterable of row lists from csv.reader
+        imported_tasks: List that receives cleaned task dictionaries
+        error_tasks: List that receives per-row error details
+    """
+    cdef long row_num = 2  # Start at 2 for header
+    for row in rows:
+        if row:  # Skip blank lines
+            _clean_row(headers, row, row_num, imported_tasks, error_tasks)
+        row_num += 1
+
+
+cdef _clean_row(list headers, list row, long row_num, list imported_tasks, list error_tasks):
+    cdef dict task_data = {}
+    cdef Py_ssize_t i, n = min(len(headers), len(row))
+    cdef str header, value
+    
+    try:
+        # Clean up the row data; columns without a header are dropped
+        for i in range(n):
+            header = headers[i]
+            if header:
+                value = row[i]
+                task_data[header] = value.strip()
+        
+        # Validate required fields
+        if not task_data.get('task'):
+            error_tasks.append({
+                'row': row_num,
+                'error': 'Missing required field: task',
+                'data': task_data
+            })
+            return
+        
+        # Add default values for missing fields
+        task_data = {**_ROW_DEFAULTS, **task_data}
+        
+        # Set created_date if not provided
+        if not task_data.get('created_date'):
+            task_data['created_date'] = datetime.now().isoformat()
+        
+        imported_tasks.append(task_data)
+        
+    except Exception as e:
+        error_tasks.append({
+            'row': row_num,
+            'error': str(e),
+            'data': row
+        })
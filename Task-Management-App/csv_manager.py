@@ -1,18 +1,26 @@
+import asyncio
 import csv
+import functools
+import io
 import os
+import operator
 import uuid
 import tempfile
-import shutil
 import time
 import platform
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set, Tuple, Iterator
 from contextlib import contextmanager
 
+from models import is_valid_iso_datetime
+
 # Import file locking based on platform
 try:
     import fcntl
     HAS_FCNTL = True
+    HAS_MSVCRT = False
 except ImportError:
     # Windows doesn't have fcntl, we'll use msvcrt
     try:
@@ -22,6 +30,29 @@ except ImportError:
         HAS_MSVCRT = False
     HAS_FCNTL = False
 
+# Buffer size for whole-file reads and rewrites (1 MiB instead of the 8 KiB default)
+IO_BUFFER_SIZE = 1024 * 1024
+
+
+def _serialized(method):
+    """
+    Run a CSVManager write method under the instance's write lock, so
+    read-modify-write cycles from different threads don't overwrite each
+    other. Other processes are still only coordinated by the file locks.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            if not self._write_depth:
+                # A new top-level write (see last_write_versions)
+                self._write_state.versions = None
+            self._write_depth += 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._write_depth -= 1
+    return wrapper
+
 
 class CSVManager:
     """
@@ -29,17 +60,89 @@ class CSVManager:
     and comprehensive error handling.
     """
     
-    def __init__(self, csv_file_path: str = 'tasks.csv'):
+    LOCK_MODES = ('auto', 'fcntl', 'msvcrt', 'none')
+    
+    # Compact once deleted-but-present rows exceed this share of the file
+    COMPACT_RATIO = 0.2
+    
+    # Managers kept for other files read through read_tasks_many
+    MAX_READERS = 8
+    
+    # Column layout, computed once instead of per row
+    _HEADERS = (
+        'id', 'task', 'priority', 'description', 'created_date',
+        'assignee', 'opened_date', 'status', 'completion_date',
+        'category', 'tags'
+    )
+    _DATE_FIELDS = frozenset({'created_date', 'opened_date', 'completion_date'})
+    _HEADER_DATE_MASK = tuple(map(_DATE_FIELDS.__contains__, _HEADERS))
+    
+    def __init__(self, csv_file_path: str = 'tasks.csv', lock_mode: str = 'auto',
+                 read_only: bool = False):
+        """
+        lock_mode selects how the CSV file is locked:
+        'auto' picks fcntl or msvcrt for the platform, 'fcntl' and 'msvcrt'
+        force that mechanism, and 'none' disables file locking. 'none' avoids
+        lock round-trips on network filesystems (NFS/SMB), where advisory
+        locks are slow or unreliable anyway, but is only safe when a single
+        process writes the file.
+        read_only managers never create the CSV file; reading a missing file
+        raises CSVManagerError instead.
+        """
+        if lock_mode not in self.LOCK_MODES:
+            raise ValueError(f"lock_mode must be one of {', '.join(self.LOCK_MODES)}")
+        if lock_mode == 'auto':
+            lock_mode = 'fcntl' if HAS_FCNTL else 'msvcrt' if HAS_MSVCRT else 'none'
+        elif lock_mode == 'fcntl' and not HAS_FCNTL or lock_mode == 'msvcrt' and not HAS_MSVCRT:
+            raise CSVManagerError(f"{lock_mode} locking is not available on this platform")
+        self.lock_mode = lock_mode
+        self.read_only = read_only
+        
         self.csv_file_path = csv_file_path
-        self.headers = [
-            'id', 'task', 'priority', 'description', 'created_date',
-            'assignee', 'opened_date', 'status', 'completion_date',
-            'category', 'tags'
-        ]
+        self.headers = list(self._HEADERS)
+        
+        # Deleted task IDs not yet compacted out of the CSV, one per line
+        self.tombstone_path = csv_file_path + '.tombstones'
+        self._tombstones: frozenset = frozenset()
+        self._tombstones_state: Optional[Tuple[int, int]] = None
+        
+        # Tombstone file handle while its exclusive lock is held (see _tombstone_lock)
+        self._tombstone_file = None
+        
+        # IDs of the tasks in the file, valid while the file state is unchanged
+        self._id_cache: Optional[Set[str]] = None
+        self._id_cache_state: Optional[Tuple[int, int]] = None
+        
+        # Parsed tasks and their id -> position index, keyed on data_version()
+        self._tasks_cache: Optional[Tuple[Tuple[int, int], List[Dict[str, Any]], Dict[str, int]]] = None
+        
+        # Column view of the cached tasks: (tasks list it was built from, columns)
+        self._columns_cache: Optional[Tuple[List[Dict[str, Any]], Dict[str, Tuple[Any, ...]]]] = None
+        
+        # Read-only managers for other CSV files read through
+        # read_tasks_many, by absolute path, least recently used first
+        self._readers: 'OrderedDict[str, CSVManager]' = OrderedDict()
+        
+        # Held by the write methods (see _serialized); reentrant since they
+        # call each other
+        self._write_lock = threading.RLock()
+        self._write_depth = 0
+        
+        # Per-thread data versions of the last write (see last_write_versions)
+        self._write_state = threading.local()
+        
+        # Per-thread state of an open batch() block
+        self._batch_state = threading.local()
+        
         self._ensure_csv_exists()
     
     def _ensure_csv_exists(self):
         """Create CSV file with headers if it doesn't exist or is empty."""
+        if self.read_only:
+            if not os.path.isfile(self.csv_file_path):
+                raise CSVManagerError(f"CSV file not found: {self.csv_file_path}")
+            return
+        
         if not os.path.exists(self.csv_file_path) or os.path.getsize(self.csv_file_path) == 0:
             try:
                 with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as file:
@@ -52,26 +155,30 @@ class CSVManager:
     def _file_lock(self, file_handle, lock_type='exclusive'):
         """
         Context manager for file locking to handle concurrent access.
-        Uses fcntl on Unix-like systems and msvcrt on Windows.
+        Uses fcntl on Unix-like systems and msvcrt on Windows, as chosen by
+        lock_mode. msvcrt only has exclusive locks, so shared (read) locks are
+        skipped there and readers rely on the atomic rename in write_tasks
+        instead of serializing behind each other.
         """
+        mode = self.lock_mode
+        if mode == 'none' or (mode == 'msvcrt' and lock_type != 'exclusive'):
+            yield file_handle
+            return
+        
         locked = False
         try:
-            if HAS_FCNTL:
+            if mode == 'fcntl':
                 # Unix-like systems (Linux, macOS)
                 lock_flag = fcntl.LOCK_EX if lock_type == 'exclusive' else fcntl.LOCK_SH
                 fcntl.flock(file_handle.fileno(), lock_flag)
                 locked = True
-            elif HAS_MSVCRT:
+            else:
                 # Windows systems
                 retry_count = 0
                 max_retries = 10
                 while retry_count < max_retries:
                     try:
-                        if lock_type == 'exclusive':
-                            msvcrt.locking(file_handle.fileno(), msvcrt.LK_NBLCK, 1)
-                        else:
-                            # Shared locks not directly supported in msvcrt, use exclusive
-                            msvcrt.locking(file_handle.fileno(), msvcrt.LK_NBLCK, 1)
+                        msvcrt.locking(file_handle.fileno(), msvcrt.LK_NBLCK, 1)
                         locked = True
                         break
                     except IOError:
@@ -85,14 +192,35 @@ class CSVManager:
             
         finally:
             if locked:
-                if HAS_FCNTL:
+                if mode == 'fcntl':
                     fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
-                elif HAS_MSVCRT:
+                else:
                     try:
                         msvcrt.locking(file_handle.fileno(), msvcrt.LK_UNLCK, 1)
                     except IOError:
                         pass  # File might already be unlocked
     
+    @contextmanager
+    def _locked_append(self):
+        """
+        Open the CSV file for appending under its exclusive lock. If a
+        rewrite replaced the file while we waited for the lock, the handle
+        points at the old, unlinked file and the row would be lost, so
+        reopen until the locked file is the current one.
+        """
+        while True:
+            with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as file:
+                with self._file_lock(file, 'exclusive'):
+                    opened = os.fstat(file.fileno())
+                    try:
+                        current = os.stat(self.csv_file_path)
+                    except FileNotFoundError:
+                        current = None
+                    
+                    if current is not None and (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino):
+                        yield file
+                        return
+    
     def _validate_csv_structure(self, file_path: str) -> bool:
         """Validate that CSV file has correct headers."""
         try:
@@ -107,47 +235,170 @@ class CSVManager:
         except (IOError, OSError, StopIteration):
             return False
     
+    def _file_state(self, path: Optional[str] = None, file=None) -> Optional[Tuple[int, int]]:
+        """
+        Get a file's (mtime_ns, size), or None if it can't be stat'ed.
+        Stats the open file if given, otherwise the path; defaults to the CSV.
+        """
+        try:
+            st = os.fstat(file.fileno()) if file is not None else os.stat(path or self.csv_file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def data_version(self) -> Optional[Tuple[Tuple[int, int], Optional[Tuple[int, int]]]]:
+        """
+        Identify the current task data: the state of the CSV file and of its
+        tombstones. Changes whenever a task is written or deleted.
+        Returns None if the CSV file can't be stat'ed.
+        """
+        state = self._file_state()
+        if state is None:
+            return None
+        return (state, self._file_state(self.tombstone_path))
+    
+    def last_write_versions(self):
+        """
+        Get the data versions (see data_version) from before and after the
+        last top-level write made by this thread, as a (before, after) pair.
+        Both are taken under the write's file locks, and after only reflects
+        the write itself: if anything else changed the data meanwhile, it
+        won't match data_version(). Returns None if the call wrote nothing;
+        after is None if the write couldn't be followed.
+        """
+        return getattr(self._write_state, 'versions', None)
+    
+    def _note_write(self, before, after) -> None:
+        """
+        Record a write's data versions for last_write_versions(), chaining
+        writes made within one top-level call (e.g. delete_tasks then compact).
+        """
+        versions = getattr(self._write_state, 'versions', None)
+        if versions is None:
+            self._write_state.versions = (before, after)
+        else:
+            first, last = versions
+            self._write_state.versions = (first, after if last is not None and last == before else None)
+    
+    def _load_tombstones(self) -> frozenset:
+        """Get the set of deleted-but-not-compacted task IDs."""
+        state = self._file_state(self.tombstone_path)
+        if state == self._tombstones_state:
+            return self._tombstones
+        
+        tombstones = frozenset()
+        if state is not None:
+            try:
+                with open(self.tombstone_path, 'r', encoding='utf-8') as file:
+                    tombstones = frozenset(line.strip() for line in file if line.strip())
+            except FileNotFoundError:
+                state = None
+        
+        self._tombstones = tombstones
+        self._tombstones_state = state
+        return tombstones
+    
+    @contextmanager
+    def _tombstone_lock(self):
+        """
+        Hold the tombstone file's exclusive lock, yielding its handle (opened
+        for appending). Rewrites hold it from reading the tasks until the new
+        file is in place, so no delete can slip in between and get dropped.
+        Reentrant; only used by the write methods, which the write lock
+        already serializes within the process.
+        """
+        if self._tombstone_file is not None:
+            yield self._tombstone_file
+            return
+        
+        try:
+            file = open(self.tombstone_path, 'a+', encoding='utf-8')
+        except (IOError, OSError) as e:
+            raise CSVManagerError(f"Failed to open tombstone file: {str(e)}")
+        
+        with file:
+            with self._file_lock(file, 'exclusive'):
+                self._tombstone_file = file
+                try:
+                    yield file
+                finally:
+                    self._tombstone_file = None
+    
+    def _drop_tombstones(self, task_ids) -> None:
+        """
+        Remove the given IDs from the tombstone file, keeping any others.
+        The caller must hold _tombstone_lock.
+        """
+        if not task_ids:
+            return
+        
+        remaining = self._load_tombstones() - frozenset(task_ids)
+        file = self._tombstone_file
+        file.seek(0)
+        file.truncate()
+        file.write(''.join(f'{task_id}\n' for task_id in remaining))
+        file.flush()
+    
+    def _live_ids(self) -> Set[str]:
+        """Get the IDs of the tasks in the file that haven't been deleted."""
+        return self._load_id_cache() - self._load_tombstones()
+    
+    def _load_id_cache(self) -> Set[str]:
+        """
+        Get the set of task IDs in the CSV file, re-reading the file only if
+        it changed since the IDs were last collected. Only the ID column is
+        looked at; rows are not parsed into tasks. The caller must hold the
+        file lock.
+        """
+        state = self._file_state()
+        if self._id_cache is not None and state == self._id_cache_state:
+            return self._id_cache
+        
+        ids = set()
+        with open(self.csv_file_path, 'r', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE) as file:
+            reader = csv.reader(file)
+            next(reader, None)  # Skip headers
+            for row in reader:
+                if len(row) == len(self.headers):
+                    ids.add(row[0].strip())
+        
+        self._id_cache = ids
+        self._id_cache_state = state
+        return ids
+    
     def _parse_task_row(self, row: List[str]) -> Optional[Dict[str, Any]]:
         """Parse a CSV row into a task dictionary with proper type conversion."""
-        if len(row) != len(self.headers):
+        if len(row) != len(self._HEADERS):
             return None
         
-        try:
-            task = {}
-            for i, header in enumerate(self.headers):
-                value = row[i].strip() if row[i] else None
-                
-                if header in ['created_date', 'opened_date', 'completion_date']:
-                    # Handle datetime fields - keep as strings for consistency
-                    if value and value.strip():
-                        task[header] = value.strip()
-                    else:
-                        task[header] = None
-                else:
-                    task[header] = value
+        task = {}
+        for header, is_date, value in zip(self._HEADERS, self._HEADER_DATE_MASK, row):
+            value = value.strip() if value else None
             
-            return task
-        except (ValueError, IndexError):
-            return None
+            if is_date:
+                # Handle datetime fields - keep as strings for consistency
+                task[header] = value or None
+            else:
+                task[header] = value
+        
+        return task
     
     def _format_task_row(self, task: Dict[str, Any]) -> List[str]:
-        """Format a task dictionary into a CSV row."""
+        """
+        Format a task dictionary into a CSV row.
+        Date fields must already be ISO strings (see add_task); they are
+        written as given, minus surrounding whitespace.
+        """
         row = []
-        for header in self.headers:
-            value = task.get(header, '')
+        append = row.append
+        get = task.get
+        for header, is_date in zip(self._HEADERS, self._HEADER_DATE_MASK):
+            value = get(header, '')
             
-            if header in ['created_date', 'opened_date', 'completion_date']:
-                # Format datetime fields
-                if isinstance(value, datetime):
-                    row.append(value.isoformat())
-                elif value and str(value).strip():
-                    # Handle string dates (ISO format or other valid date strings)
-                    row.append(str(value).strip())
-                else:
-                    # Empty or None values
-                    row.append('')
+            if is_date:
+                append(str(value).strip() if value else '')
             else:
-                row.append(str(value) if value is not None else '')
+                append(str(value) if value is not None else '')
         
         return row
     
@@ -156,8 +407,125 @@ class CSVManager:
         Read all tasks from CSV file with error handling.
         Returns list of task dictionaries.
         """
-        tasks = []
+        return list(self._load_tasks()[1])
+    
+    async def read_tasks_many(self, paths: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Read tasks from several CSV files (e.g. shards or backup snapshots)
+        concurrently. Each file is read by read_tasks on the default
+        thread pool, so the blocking reads and parsing overlap.
+        Returns one task list per path, in the order given.
+        """
+        loop = asyncio.get_running_loop()
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(None, self._reader_for(path).read_tasks)
+            for path in paths
+        )))
+    
+    def _reader_for(self, path: str) -> 'CSVManager':
+        """
+        Get a read-only manager for another CSV file. The last MAX_READERS
+        are kept so their caches persist across calls.
+        """
+        abs_path = os.path.abspath(path)
+        if abs_path == os.path.abspath(self.csv_file_path):
+            return self
+        
+        reader = self._readers.get(abs_path)
+        if reader is None:
+            reader = CSVManager(path, lock_mode=self.lock_mode, read_only=True)
+            self._readers[abs_path] = reader
+            if len(self._readers) > self.MAX_READERS:
+                self._readers.popitem(last=False)
+        else:
+            self._readers.move_to_end(abs_path)
+        return reader
+    
+    def read_tasks_columnar(self) -> Dict[str, Tuple[Any, ...]]:
+        """
+        Read all tasks as columns: a dict mapping each header to a tuple of
+        that field's values in file order. Whole-column work (counting
+        statuses, collecting categories) can run over one flat tuple instead
+        of probing a dict per task. Built from the parsed-task cache and
+        kept until the tasks change.
+        """
+        return self.read_tasks_columnar_versioned()[1]
+    
+    def read_tasks_columnar_versioned(self) -> Tuple[Optional[tuple], Dict[str, Tuple[Any, ...]]]:
+        """
+        Like read_tasks_columnar, but also returns the data_version() the
+        columns were built from, as a (version, columns) pair. Use it to key
+        anything derived from the columns; a fresh data_version() may
+        already include a later write.
+        """
+        version, tasks, _ = self._load_tasks()
+        
+        cache = self._columns_cache
+        if cache is not None and cache[0] is tasks:
+            return version, dict(cache[1])
+        
+        if tasks:
+            get_fields = operator.itemgetter(*self._HEADERS)
+            columns = dict(zip(self._HEADERS, zip(*map(get_fields, tasks))))
+        else:
+            columns = {header: () for header in self._HEADERS}
+        
+        self._columns_cache = (tasks, columns)
+        return version, dict(columns)
+    
+    def iter_tasks(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield tasks one at a time instead of building the whole list.
+        Serves the parsed-task cache when it is current; otherwise rows are
+        streamed straight from the file, which stays share-locked until the
+        iteration finishes or the generator is closed.
+        """
+        cache = self._fresh_tasks_cache()
+        if cache is not None:
+            yield from cache[1]
+        else:
+            yield from self._stream_tasks()
+    
+    def _fresh_tasks_cache(self, state=None):
+        """Get the parsed-task cache if it matches the current data_version()."""
+        if state is None:
+            state = self.data_version()
+        cache = self._tasks_cache
+        if cache is not None and state is not None and cache[0] == state:
+            return cache
+        return None
+    
+    def _load_tasks(self):
+        """
+        Get the parsed tasks as a (data_version, tasks, id -> position index)
+        snapshot, re-parsing the CSV file only if it changed since it was
+        last read. The list and index are shared with the cache and must not
+        be modified; writes replace them instead.
+        """
+        # Ensure CSV exists before taking its state
+        self._ensure_csv_exists()
+        
+        state = self.data_version()
+        cache = self._fresh_tasks_cache(state)
+        if cache is not None:
+            return cache
         
+        tasks = list(self._stream_tasks())
+        index = self._index_tasks(tasks)
+        cache = self._tasks_cache = (state, tasks, index)
+        return cache
+    
+    @staticmethod
+    def _index_tasks(tasks: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Map each task ID to the position of its first row. IDs can repeat
+        (e.g. rows imported without an ID column), and lookups return the
+        first match like a linear scan would.
+        """
+        return {tasks[i]['id']: i for i in range(len(tasks) - 1, -1, -1)}
+    
+    def _stream_tasks(self) -> Iterator[Dict[str, Any]]:
+        """Parse tasks from the CSV file, yielding them as they are read."""
         try:
             # Ensure CSV exists and has proper structure
             self._ensure_csv_exists()
@@ -166,32 +534,47 @@ class CSVManager:
             if not self._validate_csv_structure(self.csv_file_path):
                 raise CSVManagerError("CSV file has invalid structure")
             
-            with open(self.csv_file_path, 'r', encoding='utf-8') as file:
+            with open(self.csv_file_path, 'r', encoding='utf-8', buffering=IO_BUFFER_SIZE) as file:
                 with self._file_lock(file, 'shared'):  # Shared lock for reading
+                    # csv.reader + _parse_task_row rather than csv.DictReader:
+                    # DictReader is a pure-Python wrapper around the same
+                    # reader and measures slower once values are normalized
                     reader = csv.reader(file)
-                    next(reader)  # Skip headers
+                    next(reader, None)  # Skip headers (absent if a read-only manager sees an empty file)
                     
+                    parse_row = self._parse_task_row
+                    tombstones = self._load_tombstones()
                     for row_num, row in enumerate(reader, start=2):
                         if not any(row):  # Skip empty rows
                             continue
                         
-                        task = self._parse_task_row(row)
+                        task = parse_row(row)
                         if task:
-                            tasks.append(task)
+                            if task['id'] not in tombstones:
+                                yield task
                         else:
                             print(f"Warning: Skipping invalid row {row_num} in CSV file")
             
-            return tasks
-            
         except (IOError, OSError) as e:
             raise CSVManagerError(f"Failed to read CSV file: {str(e)}")
         except Exception as e:
             raise CSVManagerError(f"Unexpected error reading CSV: {str(e)}")
     
+    @_serialized
     def write_tasks(self, tasks: List[Dict[str, Any]]) -> None:
         """
         Write all tasks to CSV file with atomic operation and file locking.
+        Pending deletes are settled: rows of deleted tasks were already
+        filtered out when the tasks were read, so their tombstones go.
         """
+        with self._tombstone_lock():
+            self._write_tasks_locked(tasks)
+    
+    def _write_tasks_locked(self, tasks: List[Dict[str, Any]]) -> None:
+        """write_tasks, with the caller holding _tombstone_lock."""
+        tombstones = self._load_tombstones()
+        before = self.data_version()
+        
         try:
             # Write to temporary file first for atomic operation
             temp_file = tempfile.NamedTemporaryFile(
@@ -199,22 +582,32 @@ class CSVManager:
                 delete=False, 
                 newline='', 
                 encoding='utf-8',
+                buffering=IO_BUFFER_SIZE,
                 dir=os.path.dirname(self.csv_file_path) or '.'
             )
             
+            self._tasks_cache = None
+            
             try:
-                with self._file_lock(temp_file, 'exclusive'):
-                    writer = csv.writer(temp_file)
-                    writer.writerow(self.headers)
-                    
-                    for task in tasks:
-                        row = self._format_task_row(task)
-                        writer.writerow(row)
+                # No lock needed here: nobody else knows the temp file's name
+                writer = csv.writer(temp_file)
+                writer.writerow(self.headers)
+                
+                rows = [self._format_task_row(task) for task in tasks]
+                writer.writerows(rows)
                 
                 temp_file.close()
+                written_state = self._file_state(temp_file.name)
                 
-                # Atomically replace the original file
-                shutil.move(temp_file.name, self.csv_file_path)
+                # Atomically replace the original file. Holding the original's
+                # lock across the rename lets an append already in progress
+                # (add_task) finish first. Windows can't rename over a file
+                # that is held open, so this is only done with fcntl.
+                if self.lock_mode == 'fcntl' and os.path.exists(self.csv_file_path):
+                    with open(self.csv_file_path, 'rb') as current, self._file_lock(current, 'exclusive'):
+                        os.replace(temp_file.name, self.csv_file_path)
+                else:
+                    os.replace(temp_file.name, self.csv_file_path)
                 
             except Exception:
                 # Clean up temp file if something goes wrong
@@ -222,15 +615,36 @@ class CSVManager:
                 if os.path.exists(temp_file.name):
                     os.unlink(temp_file.name)
                 raise
+            
+            # The rewritten file no longer has the deleted rows; tombstones
+            # added since they were read (lock_mode 'none' only) are kept
+            self._drop_tombstones(tombstones)
+            
+            # Refresh the caches with what was just written instead of
+            # re-reading the file on the next access. The version comes from
+            # the files as written, not a fresh stat, which could include
+            # another process's change
+            version = None
+            if written_state is not None:
+                version = (written_state, self._file_state(file=self._tombstone_file))
+            self._note_write(before, version)
+            if version is not None:
+                written = [self._parse_task_row(row) for row in rows if any(row)]
+                index = self._index_tasks(written)
+                self._tasks_cache = (version, written, index)
+                self._id_cache = set(index)
+                self._id_cache_state = version[0]
                 
         except (IOError, OSError) as e:
             raise CSVManagerError(f"Failed to write CSV file: {str(e)}")
         except Exception as e:
             raise CSVManagerError(f"Unexpected error writing CSV: {str(e)}")
     
+    @_serialized
     def add_task(self, task_data: Dict[str, Any]) -> str:
         """
         Add a new task to CSV file.
+        The row is appended to the file rather than rewriting it.
         Returns the generated task ID.
         """
         # Generate ID if not provided
@@ -239,84 +653,362 @@ class CSVManager:
         
         # Set created_date if not provided
         if 'created_date' not in task_data or not task_data['created_date']:
-            task_data['created_date'] = datetime.now()
-        
-        # Read existing tasks
-        tasks = self.read_tasks()
-        
-        # Check for duplicate ID
-        if any(task['id'] == task_data['id'] for task in tasks):
-            raise CSVManagerError(f"Task with ID {task_data['id']} already exists")
+            task_data['created_date'] = datetime.now().isoformat()
         
-        # Add new task
-        tasks.append(task_data)
+        batch = self._current_batch()
+        if batch is not None:
+            if task_data['id'] in batch['ids']:
+                raise CSVManagerError(f"Task with ID {task_data['id']} already exists")
+            batch['ids'].add(task_data['id'])
+            batch['ops'].append(('add', task_data['id'], task_data))
+            return task_data['id']
         
-        # Write back to file
-        self.write_tasks(tasks)
-        
-        return task_data['id']
+        try:
+            # Ensure CSV exists and has proper structure
+            self._ensure_csv_exists()
+            if not self._validate_csv_structure(self.csv_file_path):
+                raise CSVManagerError("CSV file has invalid structure")
+            
+            # Reusing a deleted task's ID: drop the old row first so the
+            # tombstone doesn't hide the new one
+            if task_data['id'] in self._load_tombstones():
+                self.compact()
+            
+            with self._locked_append() as file:
+                # Check for duplicate ID
+                ids = self._load_id_cache()
+                if task_data['id'] in ids:
+                    raise CSVManagerError(f"Task with ID {task_data['id']} already exists")
+                
+                before = self.data_version()
+                
+                # Make sure the new row starts on its own line
+                with open(self.csv_file_path, 'rb') as tail:
+                    tail.seek(0, os.SEEK_END)
+                    if tail.tell() > 0:
+                        tail.seek(-1, os.SEEK_END)
+                        if tail.read(1) not in (b'\n', b'\r'):
+                            file.write('\r\n')
+                
+                row = self._format_task_row(task_data)
+                writer = csv.writer(file)
+                writer.writerow(row)
+                file.flush()
+                
+                version = None
+                if before is not None:
+                    version = (self._file_state(file=file), before[1])
+                self._note_write(before, version)
+                ids.add(task_data['id'])
+                self._id_cache_state = version[0] if version else None
+                
+                # Extend the parsed tasks if they were current before the append.
+                # Readers may hold the cached list and index, so extend copies
+                cache = self._tasks_cache
+                if cache is not None and cache[0] == before:
+                    cached_tasks = cache[1] + [self._parse_task_row(row)]
+                    index = dict(cache[2])
+                    index.setdefault(task_data['id'], len(cached_tasks) - 1)
+                    self._tasks_cache = (version, cached_tasks, index)
+            
+            return task_data['id']
+            
+        except CSVManagerError:
+            raise
+        except (IOError, OSError) as e:
+            raise CSVManagerError(f"Failed to write CSV file: {str(e)}")
+        except Exception as e:
+            raise CSVManagerError(f"Unexpected error writing CSV: {str(e)}")
     
     def update_task(self, task_id: str, task_data: Dict[str, Any]) -> bool:
         """
         Update an existing task in CSV file.
         Returns True if task was found and updated, False otherwise.
         """
-        tasks = self.read_tasks()
-        
-        # Find and update the task
-        task_found = False
-        for i, task in enumerate(tasks):
-            if task['id'] == task_id:
-                # Preserve the original ID and created_date
-                task_data['id'] = task_id
-                if 'created_date' not in task_data:
-                    task_data['created_date'] = task['created_date']
-                
-                tasks[i] = task_data
-                task_found = True
-                break
+        batch = self._current_batch()
+        if batch is not None:
+            if task_id not in batch['ids']:
+                return False
+            batch['ops'].append(('update', task_id, task_data))
+            return True
         
-        if not task_found:
-            return False
-        
-        # Write back to file
-        self.write_tasks(tasks)
-        return True
+        return self.update_tasks([(task_id, task_data)]) == 1
     
     def delete_task(self, task_id: str) -> bool:
         """
         Delete a task from CSV file.
         Returns True if task was found and deleted, False otherwise.
         """
-        tasks = self.read_tasks()
+        batch = self._current_batch()
+        if batch is not None:
+            if task_id not in batch['ids']:
+                return False
+            batch['ids'].discard(task_id)
+            batch['ops'].append(('delete', task_id, None))
+            return True
+        
+        return self.delete_tasks([task_id]) == 1
+    
+    def add_tasks(self, tasks: List[Dict[str, Any]]) -> int:
+        """
+        Add several tasks with a single rewrite of the CSV file.
+        Raises CSVManagerError if any ID already exists.
+        Returns the number of tasks added.
+        """
+        return self._apply_ops([('add', task['id'], task) for task in tasks])
+    
+    def update_tasks(self, updates: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Update several tasks with a single rewrite of the CSV file.
+        Takes (task_id, task_data) pairs; unknown IDs are skipped.
+        Returns the number of tasks updated.
+        """
+        return self._apply_ops([('update', task_id, task_data) for task_id, task_data in updates])
+    
+    @_serialized
+    def delete_tasks(self, task_ids: List[str]) -> int:
+        """
+        Delete several tasks. Instead of rewriting the CSV file, the IDs are
+        appended to the tombstone file and hidden from reads; the rows are
+        dropped by the next rewrite or compact(), which runs automatically
+        once tombstones exceed COMPACT_RATIO of the rows.
+        Unknown IDs are skipped.
+        Returns the number of tasks deleted.
+        """
+        try:
+            self._ensure_csv_exists()
+            
+            with self._tombstone_lock() as file:
+                live_ids = self._live_ids()
+                deleted = list(dict.fromkeys(task_id for task_id in task_ids if task_id in live_ids))
+                if not deleted:
+                    return 0
+                
+                before = self.data_version()
+                file.write(''.join(f'{task_id}\n' for task_id in deleted))
+                file.flush()
+                
+                version = None
+                if before is not None:
+                    version = (before[0], self._file_state(file=file))
+                self._note_write(before, version)
+                
+                # Drop the deleted tasks from the parsed tasks if they were current
+                cache = self._tasks_cache
+                if cache is not None and cache[0] == before and version is not None:
+                    removed = set(deleted)
+                    tasks = [task for task in cache[1] if task['id'] not in removed]
+                    index = self._index_tasks(tasks)
+                    self._tasks_cache = (version, tasks, index)
+            
+            if len(self._load_tombstones()) > self.COMPACT_RATIO * len(self._load_id_cache()):
+                self.compact()
+            
+            return len(deleted)
+            
+        except CSVManagerError:
+            raise
+        except (IOError, OSError) as e:
+            raise CSVManagerError(f"Failed to write tombstone file: {str(e)}")
+    
+    @_serialized
+    def compact(self) -> int:
+        """
+        Rewrite the CSV file without the rows of deleted tasks.
+        Returns the number of tasks removed.
+        """
+        with self._tombstone_lock():
+            tombstones = self._load_tombstones()
+            if not tombstones:
+                return 0
+            
+            removed = len(tombstones & self._load_id_cache())
+            self.write_tasks(self.read_tasks())
+            return removed
+    
+    @_serialized
+    def clear_tombstones(self) -> None:
+        """
+        Forget all pending deletes, e.g. after the CSV file has been replaced
+        wholesale.
+        """
+        with self._tombstone_lock():
+            self._drop_tombstones(self._load_tombstones())
+    
+    @contextmanager
+    def batch(self):
+        """
+        Context manager that buffers add/update/delete calls made by the
+        current thread and writes them with a single rewrite on exit.
+        Nothing is written if the block raises. Nested batches join the
+        outermost one.
         
-        # Find and remove the task
-        original_count = len(tasks)
-        tasks = [task for task in tasks if task['id'] != task_id]
+        Usage:
+            with manager.batch():
+                manager.update_task(task_id, data)
+                manager.delete_task(other_id)
+        """
+        if self._current_batch() is not None:
+            yield self
+            return
         
-        if len(tasks) == original_count:
-            return False  # Task not found
+        self._batch_state.pending = {'ops': [], 'ids': self._live_ids()}
+        try:
+            yield self
+            ops = self._batch_state.pending['ops']
+        finally:
+            self._batch_state.pending = None
         
-        # Write back to file
-        self.write_tasks(tasks)
-        return True
+        if ops:
+            self._apply_ops(ops)
+    
+    def _current_batch(self) -> Optional[Dict[str, Any]]:
+        """Get the current thread's open batch, if any."""
+        return getattr(self._batch_state, 'pending', None)
+    
+    @_serialized
+    def _apply_ops(self, ops: List[Tuple[str, str, Optional[Dict[str, Any]]]]) -> int:
+        """
+        Apply ('add' | 'update' | 'delete', task_id, task_data) operations to
+        the tasks in one read and one rewrite. Rows are edited in place, so
+        rows sharing an ID are kept: an update replaces the first of them
+        and a delete removes all of them.
+        Returns the number of operations that matched a task.
+        """
+        # The tombstones filtered out on reading are the ones the rewrite drops
+        with self._tombstone_lock():
+            _, cached, cached_index = self._load_tasks()
+            tasks = list(cached)
+            index = dict(cached_index)
+            
+            # Deleted ID -> row count at the time of the delete. The rows go
+            # in one pass after the loop; rows added later in the batch, at or
+            # past the cutoff, stay
+            delete_cutoffs: Dict[str, int] = {}
+            
+            applied = 0
+            for op, task_id, task_data in ops:
+                position = index.get(task_id)
+                
+                if op == 'add':
+                    if position is not None:
+                        raise CSVManagerError(f"Task with ID {task_id} already exists")
+                    index[task_id] = len(tasks)
+                    tasks.append(task_data)
+                    applied += 1
+                
+                elif position is None:
+                    continue  # Task not found
+                
+                elif op == 'update':
+                    # Preserve the original ID and created_date
+                    task_data['id'] = task_id
+                    if 'created_date' not in task_data:
+                        task_data['created_date'] = tasks[position]['created_date']
+                    
+                    tasks[position] = task_data
+                    applied += 1
+                
+                elif op == 'delete':
+                    del index[task_id]
+                    delete_cutoffs[task_id] = len(tasks)
+                    applied += 1
+            
+            if not applied:
+                return 0
+            
+            if delete_cutoffs:
+                tasks = [task for position, task in enumerate(tasks)
+                         if position >= delete_cutoffs.get(task['id'], 0)]
+            
+            # Rows of tasks no operation touched must survive the rewrite as-is
+            touched = {task_id for _, task_id, _ in ops}
+            after = Counter(task['id'] for task in tasks)
+            for task_id, count in Counter(task['id'] for task in cached).items():
+                if task_id not in touched and after[task_id] != count:
+                    raise CSVManagerError(f"Refusing to rewrite CSV: rows of task {task_id!r} would be lost")
+            
+            # Write back to file
+            self.write_tasks(tasks)
+            return applied
     
     def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific task by ID.
         Returns task dictionary or None if not found.
         """
-        tasks = self.read_tasks()
+        cache = self._fresh_tasks_cache()
+        if cache is not None:
+            position = cache[2].get(task_id)
+            return dict(cache[1][position]) if position is not None else None
         
-        for task in tasks:
+        # Cold cache: stop reading at the first match
+        for task in self._stream_tasks():
             if task['id'] == task_id:
                 return task
         
         return None
     
+    def get_tasks_by_id(self, task_id: str) -> List[Dict[str, Any]]:
+        """
+        Get every row with the given ID, in file order. IDs are normally
+        unique, but imported or hand-edited files can repeat them, and
+        delete_task removes all such rows.
+        """
+        cache = self._fresh_tasks_cache()
+        if cache is not None:
+            position = cache[2].get(task_id)
+            if position is None:
+                return []
+            return [dict(task) for task in cache[1][position:] if task['id'] == task_id]
+        
+        return [task for task in self._stream_tasks() if task['id'] == task_id]
+    
     def get_task_count(self) -> int:
         """Get the total number of tasks."""
-        return len(self.read_tasks())
+        cache = self._fresh_tasks_cache()
+        if cache is not None:
+            return len(cache[1])
+        
+        try:
+            self._ensure_csv_exists()
+            return self._count_rows()
+        except (IOError, OSError) as e:
+            raise CSVManagerError(f"Failed to read CSV file: {str(e)}")
+    
+    def _count_rows(self) -> int:
+        """
+        Count the task rows in the CSV file without parsing them.
+        Without quote characters every line is one record and every comma
+        a delimiter, so if the commas add up to a full set of columns per
+        line (which also rules out blank lines), the line count is the
+        answer. Otherwise, or when there are tombstones (several rows may
+        share a deleted ID), fall back to csv.reader, still skipping
+        _parse_task_row, and count the rows that aren't tombstoned.
+        """
+        tombstones = self._load_tombstones()
+        columns = len(self._HEADERS)
+        lines = commas = 0
+        last = b'\n'
+        with open(self.csv_file_path, 'rb', buffering=0) as file:
+            with self._file_lock(file, 'shared'):
+                for chunk in iter(lambda: file.read(IO_BUFFER_SIZE), b''):
+                    if tombstones or b'"' in chunk:
+                        break
+                    lines += chunk.count(b'\n')
+                    commas += chunk.count(b',')
+                    last = chunk[-1:]
+                else:
+                    if last != b'\n':
+                        lines += 1  # Final line without a newline
+                    if lines and commas == (columns - 1) * lines:
+                        return lines - 1  # Minus the header
+                
+                file.seek(0)
+                reader = csv.reader(io.TextIOWrapper(file, encoding='utf-8', newline=''))
+                next(reader, None)  # Skip headers
+                return sum(1 for row in reader
+                           if len(row) == columns and any(row) and row[0].strip() not in tombstones)
     
     def validate_task_data(self, task_data: Dict[str, Any]) -> List[str]:
         """
@@ -339,15 +1031,14 @@ class CSVManager:
         if 'status' in task_data and task_data['status'] not in valid_statuses:
             errors.append(f"Status must be one of: {', '.join(valid_statuses)}")
         
-        # Date validation
+        # Date validation. Dates are stored as given, so only ISO strings
+        # are accepted (see _format_task_row)
         date_fields = ['created_date', 'opened_date', 'completion_date']
         for field in date_fields:
             if field in task_data and task_data[field] is not None:
-                if not isinstance(task_data[field], datetime):
-                    try:
-                        datetime.fromisoformat(str(task_data[field]).replace('Z', '+00:00'))
-                    except ValueError:
-                        errors.append(f"{field} must be a valid datetime")
+                value = task_data[field]
+                if not isinstance(value, str) or not is_valid_iso_datetime(value):
+                    errors.append(f"{field} must be a valid ISO datetime string")
         
         return errors
 
@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for serving the Flask Todo App in production
+
+    gunicorn -c gunicorn_conf.py app:app
+
+Settings can be overridden with the GUNICORN_* environment variables below.
+"""
+import multiprocessing
+import os
+
+# Run from the app directory so the relative tasks.csv and backups/ paths resolve
+chdir = os.path.dirname(os.path.abspath(__file__))
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Workers share tasks.csv through file locks; each keeps its own caches,
+# which are keyed on the file's mtime and size so they stay coherent
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# Threaded workers overlap requests waiting on disk I/O within a process
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+timeout = 30
+keepalive = 5
+
+accesslog = '-'
+errorlog = '-'
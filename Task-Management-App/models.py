@@ -1,9 +1,11 @@
 """
 Task data model and validation for Flask Todo App
 """
+import re
 import uuid
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
 
@@ -23,6 +25,16 @@ class Status(Enum):
     ON_HOLD = "On Hold"
 
 
+# Valid field values, for cheap membership checks in Task.validate
+_PRIORITY_VALUES = frozenset(p.value for p in Priority)
+_STATUS_VALUES = frozenset(s.value for s in Status)
+
+# Tag format: letters, numbers, spaces, hyphens and underscores, with at
+# least one letter or number. The first letter or number is the only place
+# [^\W_] can match after the leading [ _-]*, so matching runs in linear time
+_TAG_RE = re.compile(r'[ _-]*[^\W_][\w -]*')
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors"""
     pass
@@ -31,6 +43,11 @@ class ValidationError(Exception):
 class Task:
     """Task model with validation"""
     
+    # No per-instance __dict__: smaller tasks and faster attribute access
+    __slots__ = ('id', 'task', 'priority', 'description', 'created_date',
+                 'assignee', 'opened_date', 'status', 'completion_date',
+                 'category', 'tags')
+    
     def __init__(self, task: str, priority: str = "Medium", description: str = "", 
                  assignee: str = "", opened_date: Optional[str] = None, 
                  status: str = "Not Started", completion_date: Optional[str] = None,
@@ -75,7 +92,44 @@ class Task:
             ValidationError: If any field is invalid
         """
         errors = []
+        for check in self._FIELD_CHECKS.values():
+            check(self, errors)
+        self._check_completion_invariant(errors)
+        
+        if errors:
+            raise ValidationError("; ".join(errors))
+    
+    def _validate_fields(self, fields) -> None:
+        """
+        Validate only the given fields, plus the status/completion date rule
+        if either of them is among them
+        
+        Raises:
+            ValidationError: If any of the fields is invalid
+        """
+        errors = []
+        for field, check in self._FIELD_CHECKS.items():
+            if field in fields:
+                check(self, errors)
+        if 'status' in fields or 'completion_date' in fields:
+            self._check_completion_invariant(errors)
+        
+        if errors:
+            raise ValidationError("; ".join(errors))
+    
+    def _validate_completion_invariant(self) -> None:
+        """
+        Validate only that the status and completion date agree
         
+        Raises:
+            ValidationError: If they don't
+        """
+        errors = []
+        self._check_completion_invariant(errors)
+        if errors:
+            raise ValidationError("; ".join(errors))
+    
+    def _check_task(self, errors: list) -> None:
         # Validate required fields
         if not self.task or not self.task.strip():
             errors.append("Task title is required")
@@ -83,65 +137,75 @@ class Task:
         # Validate task title length
         if self.task and len(self.task.strip()) > 200:
             errors.append("Task title must be 200 characters or less")
-        
-        # Validate priority
-        try:
-            Priority(self.priority)
-        except ValueError:
+    
+    def _check_priority(self, errors: list) -> None:
+        # The isinstance check also keeps unhashable JSON values like lists
+        # out of the set lookup
+        if not isinstance(self.priority, str) or self.priority not in _PRIORITY_VALUES:
             valid_priorities = [p.value for p in Priority]
             errors.append(f"Priority must be one of: {', '.join(valid_priorities)}")
-        
-        # Validate status
-        try:
-            Status(self.status)
-        except ValueError:
+    
+    def _check_status(self, errors: list) -> None:
+        if not isinstance(self.status, str) or self.status not in _STATUS_VALUES:
             valid_statuses = [s.value for s in Status]
             errors.append(f"Status must be one of: {', '.join(valid_statuses)}")
-        
-        # Validate description length
+    
+    def _check_description(self, errors: list) -> None:
         if self.description and len(self.description) > 1000:
             errors.append("Description must be 1000 characters or less")
-        
-        # Validate assignee length
+    
+    def _check_assignee(self, errors: list) -> None:
         if self.assignee and len(self.assignee) > 100:
             errors.append("Assignee name must be 100 characters or less")
-        
-        # Validate category length
+    
+    def _check_category(self, errors: list) -> None:
         if self.category and len(self.category) > 50:
             errors.append("Category must be 50 characters or less")
-        
-        # Validate tags format and length
+    
+    def _check_tags(self, errors: list) -> None:
         if self.tags:
             if len(self.tags) > 200:
                 errors.append("Tags must be 200 characters or less")
+                return
             # Validate tag format (comma-separated, no special characters except spaces and hyphens)
-            tag_list = [tag.strip() for tag in self.tags.split(',') if tag.strip()]
-            for tag in tag_list:
-                if not tag.replace(' ', '').replace('-', '').replace('_', '').isalnum():
+            for tag in self.tags.split(','):
+                tag = tag.strip()
+                if tag and not _TAG_RE.fullmatch(tag):
                     errors.append(f"Tag '{tag}' contains invalid characters. Use only letters, numbers, spaces, hyphens, and underscores")
-        
-        # Validate date formats
-        if self.created_date:
-            if not self._is_valid_datetime(self.created_date):
-                errors.append("Created date must be in ISO format (YYYY-MM-DDTHH:MM:SSZ)")
-        
-        if self.opened_date:
-            if not self._is_valid_datetime(self.opened_date):
-                errors.append("Opened date must be in ISO format (YYYY-MM-DDTHH:MM:SSZ)")
-        
-        if self.completion_date:
-            if not self._is_valid_datetime(self.completion_date):
-                errors.append("Completion date must be in ISO format (YYYY-MM-DDTHH:MM:SSZ)")
-        
+    
+    def _check_created_date(self, errors: list) -> None:
+        if self.created_date and not self._is_valid_datetime(self.created_date):
+            errors.append("Created date must be in ISO format (YYYY-MM-DDTHH:MM:SSZ)")
+    
+    def _check_opened_date(self, errors: list) -> None:
+        if self.opened_date and not self._is_valid_datetime(self.opened_date):
+            errors.append("Opened date must be in ISO format (YYYY-MM-DDTHH:MM:SSZ)")
+    
+    def _check_completion_date(self, errors: list) -> None:
+        if self.completion_date and not self._is_valid_datetime(self.completion_date):
+            errors.append("Completion date must be in ISO format (YYYY-MM-DDTHH:MM:SSZ)")
+    
+    def _check_completion_invariant(self, errors: list) -> None:
         # Validate business logic
         if self.status == Status.COMPLETED.value and not self.completion_date:
             errors.append("Completed tasks must have a completion date")
         
         if self.status != Status.COMPLETED.value and self.completion_date:
             errors.append("Only completed tasks can have a completion date")
-        
-        if errors:
-            raise ValidationError("; ".join(errors))
+    
+    # Per-field checks, in the order validate() reports them
+    _FIELD_CHECKS = {
+        'task': _check_task,
+        'priority': _check_priority,
+        'status': _check_status,
+        'description': _check_description,
+        'assignee': _check_assignee,
+        'category': _check_category,
+        'tags': _check_tags,
+        'created_date': _check_created_date,
+        'opened_date': _check_opened_date,
+        'completion_date': _check_completion_date,
+    }
     
     def _is_valid_datetime(self, date_string: str) -> bool:
         """
@@ -153,21 +217,10 @@ class Task:
         Returns:
             bool: True if valid datetime format
         """
-        if not date_string:
+        if not date_string or not isinstance(date_string, str):
             return False
         
-        try:
-            # Try to parse the datetime string directly
-            if date_string.endswith('Z'):
-                datetime.fromisoformat(date_string[:-1])
-            elif '+' in date_string or date_string.count('-') > 2:
-                # Handle timezone offsets
-                datetime.fromisoformat(date_string.replace('Z', ''))
-            else:
-                datetime.fromisoformat(date_string)
-            return True
-        except ValueError:
-            return False
+        return is_valid_iso_datetime(date_string)
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -221,20 +274,24 @@ class Task:
         """
         self.status = Status.COMPLETED.value
         self.completion_date = datetime.now().isoformat()
-        self.validate()
+        
+        # Both fields are valid by construction; only their pairing needs checking
+        self._validate_completion_invariant()
     
     def update_fields(self, **kwargs) -> None:
         """
-        Update task fields and validate
+        Update task fields and validate the ones that changed
         
         Args:
             **kwargs: Fields to update
         """
+        changed = set()
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in self.__slots__:
                 setattr(self, key, value)
+                changed.add(key)
         
-        self.validate()
+        self._validate_fields(changed)
     
     def __str__(self) -> str:
         """String representation of task"""
@@ -271,6 +328,31 @@ def format_datetime(dt: Optional[datetime] = None) -> str:
     return dt.isoformat()
 
 
+@lru_cache(maxsize=4096)
+def is_valid_iso_datetime(date_string: str) -> bool:
+    """
+    Check if a string is a valid ISO datetime, allowing a trailing 'Z'.
+    Results are cached, since the same timestamps recur across tasks
+    and imported rows.
+    
+    Args:
+        date_string: String to validate
+        
+    Returns:
+        bool: True if valid datetime format
+    """
+    try:
+        # Try to parse the datetime string directly
+        if date_string.endswith('Z'):
+            datetime.fromisoformat(date_string[:-1])
+        else:
+            # Handle timezone offsets
+            datetime.fromisoformat(date_string.replace('Z', ''))
+        return True
+    except ValueError:
+        return False
+
+
 def parse_datetime(date_string: str) -> Optional[datetime]:
     """
     Parse ISO datetime string
@@ -0,0 +1,19 @@
+"""
+Build script for the optional Cython CSV import extension
+
+    python setup.py build_ext --inplace
+
+Without Cython installed the app falls back to the pure-Python importer.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['csv_import_fast.pyx'])
+except ImportError:
+    ext_modules = []
+
+setup(
+    py_modules=['app', 'models', 'csv_manager', 'csv_export_import'],
+    ext_modules=ext_modules,
+)
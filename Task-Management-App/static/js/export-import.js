@@ -314,8 +314,9 @@ function importTasks() {
 
 /**
  * Create a backup of current tasks
+ * @param {Function} [onDone] - Called once the backup has finished or failed
  */
-function createBackup() {
+function createBackup(onDone) {
     showLoading('Creating backup...');
     
     $.ajax({
@@ -326,7 +327,9 @@ function createBackup() {
             hideLoading();
             
             if (response.success) {
-                showSuccess('Backup created successfully');
+                // The copy runs in the background; report once it has finished
+                showSuccess('Backup started');
+                pollBackupStatus(response.job_id, onDone);
             } else {
                 showError(response.error || 'Failed to create backup');
             }
@@ -347,6 +350,48 @@ function createBackup() {
     });
 }
 
+/**
+ * Poll a background backup until it completes or fails
+ * @param {string} jobId - Job ID returned by POST /api/backup
+ * @param {Function} [onDone] - Called once the backup has finished or failed
+ * @param {number} [attempt] - Number of polls made so far
+ */
+function pollBackupStatus(jobId, onDone, attempt = 0) {
+    const maxAttempts = 60;
+    
+    $.ajax({
+        url: `/api/backups/status/${encodeURIComponent(jobId)}`,
+        type: 'GET',
+        success: function(response) {
+            const status = response.backup ? response.backup.status : null;
+            
+            if (status === 'pending' && attempt < maxAttempts) {
+                setTimeout(() => pollBackupStatus(jobId, onDone, attempt + 1), 1000);
+                return;
+            }
+            
+            if (status === 'completed') {
+                showSuccess('Backup created successfully');
+            } else if (status === 'failed') {
+                showError(`Backup failed: ${response.backup.error}`);
+            } else {
+                showError('Backup is taking longer than expected; check the backups list later');
+            }
+            
+            if (onDone) {
+                onDone();
+            }
+        },
+        error: function() {
+            showError('Could not check the backup status');
+            
+            if (onDone) {
+                onDone();
+            }
+        }
+    });
+}
+
 /**
  * Show backups management modal
  */
@@ -409,8 +454,7 @@ function showBackupsModal() {
         
         // Add event handlers
         $('#create-backup-btn').on('click', function() {
-            createBackup();
-            setTimeout(loadBackups, 1000);
+            createBackup(loadBackups);
         });
         
         $('#refresh-backups-btn').on('click', function() {
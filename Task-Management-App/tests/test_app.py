@@ -0,0 +1,129 @@
+"""
+Regression tests for the task API: lookups and incremental stats when
+several rows share an ID, and stats kept in step with concurrent writes
+"""
+import importlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from csv_manager import CSVManager
+
+app_module = None
+_old_cwd = None
+_module_dir = None
+
+
+def setUpModule():
+    # app.py creates tasks.csv and backups/ in the working directory on import
+    global app_module, _old_cwd, _module_dir
+    _old_cwd = os.getcwd()
+    _module_dir = tempfile.mkdtemp()
+    os.chdir(_module_dir)
+    app_module = importlib.import_module('app')
+
+
+def tearDownModule():
+    os.chdir(_old_cwd)
+    shutil.rmtree(_module_dir, ignore_errors=True)
+
+
+class AppTestCase(unittest.TestCase):
+    """Base case that points the app at a fresh CSV file"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'tasks.csv')
+        self.manager = CSVManager(self.csv_path)
+        
+        self.old_manager = app_module.app.csv_manager
+        app_module.app.csv_manager = self.manager
+        app_module.invalidate_tasks_cache()
+        app_module._stats_state['key'] = None
+        
+        self.client = app_module.app.test_client()
+    
+    def tearDown(self):
+        app_module.app.csv_manager = self.old_manager
+        app_module.invalidate_tasks_cache()
+        app_module._stats_state['key'] = None
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+    
+    def append_raw_rows(self, *rows):
+        """Append rows to the CSV file behind the app's back"""
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as file:
+            for row in rows:
+                file.write(row + '\n')
+    
+    def stats(self):
+        return self.client.get('/api/stats').get_json()['stats']
+    
+    def recounted_stats(self):
+        """Stats counted from scratch, for comparison"""
+        app_module._stats_state['key'] = None
+        return self.stats()
+
+
+class TestDuplicateIds(AppTestCase):
+    
+    def setUp(self):
+        super().setUp()
+        self.append_raw_rows('d,first,Low,,2026-01-01T00:00:00,,,On Hold,,,',
+                             'd,second,High,,2026-01-01T00:00:00,,,On Hold,,,')
+    
+    def test_put_updates_the_first_row_only(self):
+        response = self.client.put('/api/tasks/d', json={'description': 'edited'})
+        
+        self.assertEqual(response.status_code, 200)
+        rows = [(task['task'], task['priority'], task['description'])
+                for task in self.manager.get_tasks_by_id('d')]
+        self.assertEqual(rows, [('first', 'Low', 'edited'), ('second', 'High', None)])
+    
+    def test_delete_removes_every_row_from_stats(self):
+        self.stats()
+        
+        response = self.client.delete('/api/tasks/d')
+        
+        self.assertEqual(response.status_code, 200)
+        stats = self.stats()
+        self.assertNotIn('On Hold', stats['by_status'])
+        self.assertNotIn('High', stats['by_priority'])
+        self.assertEqual(stats, self.recounted_stats())
+
+
+class TestStatsConsistency(AppTestCase):
+    
+    def test_append_during_rebuild_is_counted_once(self):
+        # Another writer appends between the stats taking their key and
+        # reading the columns
+        other = CSVManager(self.csv_path)
+        read_columns = self.manager.read_tasks_columnar_versioned
+        
+        def racing_read():
+            other.add_task({'task': 'sneaked in', 'priority': 'Critical'})
+            return read_columns()
+        
+        self.manager.read_tasks_columnar_versioned = racing_read
+        self.stats()
+        self.manager.read_tasks_columnar_versioned = read_columns
+        
+        self.client.post('/api/tasks', json={'task': 'after', 'priority': 'Low'})
+        
+        stats = self.stats()
+        self.assertEqual(stats['by_priority'].get('Critical'), 1)
+        self.assertEqual(stats, self.recounted_stats())
+    
+    def test_incremental_stats_match_a_recount(self):
+        self.stats()
+        
+        created = self.client.post('/api/tasks', json={'task': 'a', 'tags': 'x, y'}).get_json()
+        self.client.post('/api/tasks', json={'task': 'b', 'category': 'work'})
+        self.client.put(f"/api/tasks/{created['task_id']}", json={'priority': 'High'})
+        self.client.delete(f"/api/tasks/{created['task_id']}")
+        
+        self.assertEqual(self.stats(), self.recounted_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Regression tests for CSVManager: tombstones, compaction, batches, and
+concurrent access through more than one manager (standing in for
+separate worker processes sharing the file)
+"""
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from csv_manager import CSVManager, CSVManagerError, HAS_FCNTL
+
+
+class CSVManagerTestCase(unittest.TestCase):
+    """Base case that gives each test its own CSV file"""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.tmp_dir, 'tasks.csv')
+        self.manager = CSVManager(self.csv_path)
+    
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+    
+    def add_tasks(self, count, prefix='t'):
+        """Add count tasks with IDs prefix0, prefix1, ..."""
+        ids = [f'{prefix}{i}' for i in range(count)]
+        self.manager.add_tasks([{'id': task_id, 'task': task_id} for task_id in ids])
+        return ids
+    
+    def append_raw_rows(self, *rows):
+        """Append rows to the CSV file behind the manager's back"""
+        with open(self.csv_path, 'a', newline='', encoding='utf-8') as file:
+            for row in rows:
+                file.write(row + '\n')
+    
+    def read_ids(self):
+        """IDs of the tasks on disk, read through a fresh manager"""
+        return [task['id'] for task in CSVManager(self.csv_path).read_tasks()]
+
+
+class TestTombstones(CSVManagerTestCase):
+    
+    def test_deleted_tasks_are_hidden_before_compaction(self):
+        ids = self.add_tasks(10)
+        
+        self.assertEqual(self.manager.delete_tasks([ids[0]]), 1)
+        
+        self.assertNotIn(ids[0], self.read_ids())
+        self.assertIsNone(self.manager.get_task_by_id(ids[0]))
+        self.assertEqual(self.manager.get_task_count(), 9)
+        with open(self.manager.tombstone_path, encoding='utf-8') as file:
+            self.assertEqual(file.read().split(), [ids[0]])
+    
+    def test_compact_drops_rows_and_keeps_tombstone_file(self):
+        ids = self.add_tasks(10)
+        self.manager.delete_tasks([ids[0]])
+        
+        self.assertEqual(self.manager.compact(), 1)
+        
+        with open(self.csv_path, encoding='utf-8') as file:
+            self.assertNotIn(ids[0], file.read())
+        with open(self.manager.tombstone_path, encoding='utf-8') as file:
+            self.assertEqual(file.read(), '')
+        self.assertEqual(self.read_ids(), ids[1:])
+    
+    def test_deletes_compact_automatically_past_ratio(self):
+        ids = self.add_tasks(10)
+        
+        self.manager.delete_tasks(ids[:3])
+        
+        with open(self.csv_path, encoding='utf-8') as file:
+            self.assertNotIn(ids[0], file.read())
+        self.assertEqual(self.read_ids(), ids[3:])
+    
+    def test_readding_a_deleted_id(self):
+        ids = self.add_tasks(10)
+        self.manager.delete_tasks([ids[0]])
+        
+        self.manager.add_task({'id': ids[0], 'task': 'again'})
+        
+        self.assertEqual(self.manager.get_task_by_id(ids[0])['task'], 'again')
+        self.assertEqual(self.read_ids().count(ids[0]), 1)
+    
+    def test_count_rows_with_duplicate_deleted_id(self):
+        ids = self.add_tasks(10)
+        self.append_raw_rows('dup,first,,,2026-01-01T00:00:00,,,,,,',
+                             'dup,second,,,2026-01-01T00:00:00,,,,,,')
+        self.manager.delete_tasks(['dup'])
+        
+        # Cold manager, so the count comes from the file rather than the cache
+        self.assertEqual(CSVManager(self.csv_path)._count_rows(), len(ids))
+    
+    def test_concurrent_deletes_survive_rewrites(self):
+        # One manager keeps rewriting while another deletes tasks one at a
+        # time; every delete must stick
+        ids = self.add_tasks(200)
+        writer = CSVManager(self.csv_path)
+        deleter = CSVManager(self.csv_path)
+        stop = threading.Event()
+        
+        def rewrite():
+            while not stop.is_set():
+                writer.update_tasks([(ids[0], {'task': 'rewritten'})])
+        
+        thread = threading.Thread(target=rewrite)
+        thread.start()
+        try:
+            deleted = ids[1:150]
+            for task_id in deleted:
+                deleter.delete_tasks([task_id])
+        finally:
+            stop.set()
+            thread.join()
+        
+        self.assertFalse(set(deleted) & set(self.read_ids()))
+        self.assertTrue(os.path.exists(self.manager.tombstone_path))
+    
+    def test_clear_tombstones_restores_hidden_rows(self):
+        ids = self.add_tasks(10)
+        self.manager.delete_tasks([ids[0]])
+        
+        self.manager.clear_tombstones()
+        
+        self.assertIn(ids[0], self.read_ids())
+
+
+class TestBatches(CSVManagerTestCase):
+    
+    def test_batch_applies_ops_in_order(self):
+        ids = self.add_tasks(6)
+        self.append_raw_rows('t1,dup,,,2026-01-01T00:00:00,,,,,,')
+        manager = CSVManager(self.csv_path)
+        
+        with manager.batch():
+            manager.delete_task('t1')
+            manager.add_task({'id': 't1', 'task': 'readded'})
+            manager.delete_task('t2')
+            manager.add_task({'id': 't2', 'task': 'gone'})
+            manager.delete_task('t2')
+            manager.update_task('t3', {'task': 'updated'})
+            manager.delete_task('missing')
+        
+        tasks = [(task['id'], task['task']) for task in CSVManager(self.csv_path).read_tasks()]
+        self.assertEqual(tasks, [('t0', 't0'), ('t3', 'updated'), ('t4', 't4'),
+                                 ('t5', 't5'), ('t1', 'readded')])
+    
+    def test_update_keeps_rows_sharing_an_id(self):
+        self.add_tasks(3)
+        self.append_raw_rows('d,first,Low,,2026-01-01T00:00:00,,,,,,',
+                             'd,second,High,,2026-01-01T00:00:00,,,,,,')
+        manager = CSVManager(self.csv_path)
+        
+        manager.update_task('t0', {'task': 'changed'})
+        manager.update_task('d', {'task': 'first', 'priority': 'Medium'})
+        
+        rows = [(task['task'], task['priority']) for task in manager.get_tasks_by_id('d')]
+        self.assertEqual(rows, [('first', 'Medium'), ('second', 'High')])
+
+
+class TestConcurrentAppends(CSVManagerTestCase):
+
+    @unittest.skipUnless(HAS_FCNTL, "needs fcntl locks and renames over open files")
+    def test_append_waits_out_a_replace(self):
+        # Hold the lock, start an append from a second manager, then replace
+        # the file as write_tasks does; the append must land in the new file
+        self.add_tasks(1)
+        appender = CSVManager(self.csv_path)
+        
+        with open(self.csv_path, 'rb') as current, self.manager._file_lock(current, 'exclusive'):
+            thread = threading.Thread(target=appender.add_task, args=({'id': 'late', 'task': 'late'},))
+            thread.start()
+            time.sleep(0.2)
+            
+            replacement = self.csv_path + '.new'
+            shutil.copyfile(self.csv_path, replacement)
+            os.replace(replacement, self.csv_path)
+        thread.join()
+        
+        self.assertIn('late', self.read_ids())
+
+
+class TestReadTasksMany(CSVManagerTestCase):
+    
+    def test_missing_path_raises_without_creating_it(self):
+        missing = os.path.join(self.tmp_dir, 'missing.csv')
+        
+        with self.assertRaises(CSVManagerError):
+            asyncio.run(self.manager.read_tasks_many([missing]))
+        
+        self.assertFalse(os.path.exists(missing))
+    
+    def test_readers_are_bounded(self):
+        paths = []
+        for i in range(CSVManager.MAX_READERS + 3):
+            path = os.path.join(self.tmp_dir, f'shard{i}.csv')
+            CSVManager(path).add_task({'task': f'shard {i}'})
+            paths.append(path)
+        
+        results = asyncio.run(self.manager.read_tasks_many(paths))
+        
+        self.assertEqual([len(tasks) for tasks in results], [1] * len(paths))
+        self.assertEqual(len(self.manager._readers), CSVManager.MAX_READERS)
+
+
+if __name__ == '__main__':
+    unittest.main()